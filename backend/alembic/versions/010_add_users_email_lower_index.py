@@ -0,0 +1,34 @@
+"""Add case-insensitive unique index on users.email
+
+Revision ID: 010
+Revises: 1b4ee355f8fd
+Create Date: 2026-09-01
+
+Login and registration look users up by email. Emails are
+case-insensitive in practice, so the lookup queries on lower(email);
+this functional unique index keeps that lookup an index scan and
+enforces uniqueness regardless of stored casing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '1b4ee355f8fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('users_email_lower', table_name='users')
@@ -0,0 +1,33 @@
+"""Add composite index for status-filtered task lists
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-09-01
+
+Task list queries filter by (user_id, completed) and sort by
+created_at DESC; this composite index covers that access path so the
+filtered list is an index scan instead of filtering the per-user rows
+after fetch.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_tasks_user_completed',
+        'tasks',
+        ['user_id', 'completed', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tasks_user_completed', table_name='tasks')
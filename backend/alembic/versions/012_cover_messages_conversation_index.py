@@ -0,0 +1,41 @@
+"""Rebuild messages conversation index as a covering index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-09-01
+
+Chat-history loads filter messages by conversation_id, order by
+created_at and read role/content/tool_call_id/name. Adding those
+columns to the index with INCLUDE lets Postgres satisfy the query with
+an index-only scan instead of one heap fetch per message. Built
+CONCURRENTLY so live chat traffic isn't blocked during the rebuild.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_messages_conversation_created")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_messages_conversation_created "
+            "ON messages (conversation_id, created_at) "
+            "INCLUDE (role, content, tool_call_id, name)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_messages_conversation_created")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_messages_conversation_created "
+            "ON messages (conversation_id, created_at)"
+        )
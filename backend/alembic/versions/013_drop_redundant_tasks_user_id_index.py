@@ -0,0 +1,28 @@
+"""Drop redundant single-column tasks.user_id index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-09-01
+
+idx_tasks_user_completed (011) leads with user_id, so every scan
+ix_tasks_user_id could serve is served by the composite. Dropping the
+single-column copy saves one index maintenance write per task
+INSERT/UPDATE/DELETE and its share of cache space.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_tasks_user_id', table_name='tasks', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'])
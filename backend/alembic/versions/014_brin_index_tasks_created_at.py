@@ -0,0 +1,38 @@
+"""Swap tasks.created_at btree index for BRIN
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-09-01
+
+tasks.created_at is append-only, so row order correlates with physical
+page order - exactly the shape BRIN summarizes well. The analytics
+range scans (timeline, heatmap) keep their index support from per-page
+min/max summaries at a fraction of the btree's size and per-INSERT
+maintenance cost. Point lookups on created_at alone don't occur; the
+sorted list path is served by idx_tasks_user_completed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_tasks_created_at', table_name='tasks', if_exists=True)
+    op.create_index(
+        'ix_tasks_created_at_brin',
+        'tasks',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_created_at_brin', table_name='tasks')
+    op.create_index('ix_tasks_created_at', 'tasks', ['created_at'])
@@ -0,0 +1,34 @@
+"""Add partial index over open tasks
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-09-01
+
+"Show my open tasks" is the dominant list query while completed rows
+accumulate forever. A (user_id, created_at DESC) index restricted to
+completed = false holds only the hot set, so it stays small and
+cache-resident regardless of table growth.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_open',
+        'tasks',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('completed = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_open', table_name='tasks')
@@ -0,0 +1,32 @@
+"""Drop legacy users.password_hash column
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-09-01
+
+users carried two password columns from an old schema migration:
+hashed_password (the one authentication reads and writes) and
+password_hash (a nullable duplicate nothing touches). Dropping the
+duplicate removes up to 255 bytes of redundant hash data per row, so
+more users fit each 8K page on the login lookup path.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_column('users', 'password_hash')
+
+
+def downgrade() -> None:
+    # Recreated empty; the column held duplicated hashes, so nothing
+    # is lost that hashed_password does not still provide
+    op.add_column('users', sa.Column('password_hash', sa.String(length=255), nullable=True))
@@ -18,6 +18,7 @@ Security: user_id is injected into all tool calls from JWT authentication.
 from typing import Dict, List, Any, Optional, Tuple
 import json
 import os
+import traceback
 from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -278,7 +279,6 @@ Current User ID: {user_id} (for internal use only, don't mention this to the use
                 error_info = self._categorize_error(e)
 
                 # Log error with FULL DETAILS for debugging
-                import traceback
                 print(f"\n{'='*80}")
                 print(f"[AGENT ERROR] Type: {type(e).__name__}")
                 print(f"[AGENT ERROR] Error String: {str(e)}")
@@ -425,7 +425,6 @@ Current User ID: {user_id} (for internal use only, don't mention this to the use
                         except Exception as tool_error:
                             # Catch any errors during tool execution
                             print(f"[ERROR] Tool execution failed for {function_name}: {tool_error}")
-                            import traceback
                             print(f"[ERROR] Traceback: {traceback.format_exc()}")
                             result = {
                                 "status": "error",
@@ -692,19 +691,14 @@ Current User ID: {user_id} (for internal use only, don't mention this to the use
         # Run agent with history
         result = await self.run_agent(db, user_id, user_message, history)
 
-        # Save messages to conversation
-        # Save user message
-        await conversation_manager.save_message(
+        # Save the user message and assistant response in one batched
+        # INSERT instead of a round-trip per message
+        await conversation_manager.save_messages(
             conversation_id=conversation_id,
-            role="user",
-            content=user_message
-        )
-
-        # Save assistant response
-        await conversation_manager.save_message(
-            conversation_id=conversation_id,
-            role="assistant",
-            content=result["response"]
+            messages=[
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": result["response"]},
+            ],
         )
 
         # Add conversation_id to result
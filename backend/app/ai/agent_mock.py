@@ -13,6 +13,8 @@ It follows the same interface as the real AgentService but returns predefined re
 
 from typing import Dict, List, Any, Optional
 import json
+import sys
+import traceback
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -739,7 +741,6 @@ I can understand natural language, so feel free to ask in your own words!"""
         Returns:
             Dict with response and conversation_id
         """
-        import sys
         # For mock AI, create actual conversation in database
         conversation_manager = ConversationManager(db)
         if not conversation_id:
@@ -757,7 +758,6 @@ I can understand natural language, so feel free to ask in your own words!"""
             print(f"[MOCK] Saved user message to conversation", file=sys.stderr)
         except Exception as e:
             print(f"[MOCK] ERROR saving user message: {e}", file=sys.stderr)
-            import traceback
             print(f"[MOCK] TRACEBACK: {traceback.format_exc()}", file=sys.stderr)
 
         # Run agent
@@ -767,7 +767,6 @@ I can understand natural language, so feel free to ask in your own words!"""
         except Exception as e:
             print(f"[MOCK] ERROR in run_agent: {e}", file=sys.stderr)
             print(f"[MOCK] ERROR type: {type(e)}", file=sys.stderr)
-            import traceback
             print(f"[MOCK] TRACEBACK: {traceback.format_exc()}", file=sys.stderr)
             # Return a simple response even if agent fails
             result = {
@@ -786,7 +785,6 @@ I can understand natural language, so feel free to ask in your own words!"""
                 print(f"[MOCK] Saved assistant response to conversation", file=sys.stderr)
         except Exception as e:
             print(f"[MOCK] ERROR saving assistant message: {e}", file=sys.stderr)
-            import traceback
             print(f"[MOCK] TRACEBACK: {traceback.format_exc()}", file=sys.stderr)
 
         # Add conversation_id to result
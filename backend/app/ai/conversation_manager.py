@@ -6,13 +6,14 @@ This replaces the openai-chatkit-sdk which doesn't exist yet.
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, insert, update
 from uuid import UUID
 
 from app.models.conversation import Conversation
 from app.models.message import Message
+from app.utils.uuid7 import uuid7
 
 
 class ConversationManager:
@@ -47,7 +48,6 @@ class ConversationManager:
         """
         # Convert string to UUID if needed
         if isinstance(user_id, str):
-            from uuid import UUID
             user_id = UUID(user_id)
 
         conversation = Conversation(user_id=user_id)
@@ -73,7 +73,6 @@ class ConversationManager:
         """
         # Convert string to UUID if needed
         if isinstance(conversation_id, str):
-            from uuid import UUID
             conversation_id = UUID(conversation_id)
 
         # Query messages for this conversation
@@ -107,7 +106,6 @@ class ConversationManager:
         """
         # Convert string to UUID if needed
         if isinstance(conversation_id, str):
-            from uuid import UUID
             conversation_uuid = UUID(conversation_id)
         else:
             conversation_uuid = conversation_id
@@ -131,6 +129,68 @@ class ConversationManager:
         # Don't commit here - let the main transaction handle it
         await self.db.flush()
 
+    async def save_messages(
+        self,
+        conversation_id: str,  # Accept string UUID
+        messages: List[Dict[str, str]]
+    ) -> None:
+        """
+        Save several messages to the conversation in one INSERT.
+
+        An agent turn produces a user message plus one or more
+        assistant/tool messages; inserting them as a single executemany
+        round-trip replaces one INSERT (and one conversation lookup)
+        per message. IDs and timestamps are generated Python-side so no
+        RETURNING round-trip is needed either.
+
+        Args:
+            conversation_id: The conversation ID
+            messages: Message dicts with "role" and "content" keys
+                (optionally "tool_calls", "tool_call_id", "name")
+        """
+        if not messages:
+            return
+
+        # Convert string to UUID if needed
+        if isinstance(conversation_id, str):
+            conversation_uuid = UUID(conversation_id)
+        else:
+            conversation_uuid = conversation_id
+
+        # Stagger timestamps by a microsecond so created_at ordering
+        # stays deterministic within the batch
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid7(),
+                "conversation_id": conversation_uuid,
+                "role": msg["role"],
+                "content": msg["content"],
+                "tool_calls": msg.get("tool_calls"),
+                "tool_call_id": msg.get("tool_call_id"),
+                "name": msg.get("name"),
+                "created_at": now + timedelta(microseconds=i),
+            }
+            for i, msg in enumerate(messages)
+        ]
+        await self.db.execute(insert(Message), rows)
+
+        # Single UPDATE for the timestamp instead of SELECT-then-assign
+        await self.db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_uuid)
+            .values(updated_at=now)
+        )
+
+        # Core DML leaves session.new/dirty/deleted empty and a flush on
+        # a clean session never fires after_flush, so flag the session
+        # explicitly - otherwise get_db's conditional commit skips the
+        # COMMIT and these writes are rolled back on close
+        self.db.info["needs_commit"] = True
+
+        # Don't commit here - let the main transaction handle it
+        await self.db.flush()
+
     async def get_user_conversations(
         self,
         user_id: str,  # Accept string UUID
@@ -148,7 +208,6 @@ class ConversationManager:
         """
         # Convert string to UUID if needed
         if isinstance(user_id, str):
-            from uuid import UUID
             user_uuid = UUID(user_id)
         else:
             user_uuid = user_id
@@ -225,8 +284,6 @@ class ConversationManager:
             True if the user owns the conversation, False otherwise
         """
         # Convert strings to UUIDs if needed
-        from uuid import UUID
-
         if isinstance(conversation_id, str):
             conversation_uuid = UUID(conversation_id)
         else:
@@ -262,8 +319,6 @@ class ConversationManager:
             True if deleted successfully, False if not found or unauthorized
         """
         # Convert strings to UUIDs if needed
-        from uuid import UUID
-
         if isinstance(conversation_id, str):
             conversation_uuid = UUID(conversation_id)
         else:
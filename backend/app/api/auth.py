@@ -3,10 +3,10 @@
 Enhanced for Better Auth integration with JWT tokens.
 Updated /me endpoint with database lookup.
 """
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, status, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.database import get_db
 from app.schemas.auth import LoginRequest, TokenResponse
@@ -14,10 +14,10 @@ from app.schemas.user import UserCreate, UserResponse
 from app.crud.user import create_user, get_user_by_email, get_user_by_id
 from app.utils.security import verify_password, create_access_token, decode_token
 from app.utils.exceptions import ConflictException, UnauthorizedException
-from app.utils.rate_limit import conditional_rate_limit
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
+# Rate limiting for /register and /login (5/minute) is enforced by the
+# token-bucket middleware in app.main via ROUTE_BUCKETS
 
 
 def user_to_dict(user) -> dict:
@@ -25,7 +25,8 @@ def user_to_dict(user) -> dict:
     return {
         "id": str(user.id),  # Better Auth expects string IDs
         "email": user.email,
-        "name": getattr(user, 'name', None) or user.email.split("@")[0],  # Use name field or email prefix
+        # partition avoids split's intermediate list allocation on this hot path
+        "name": getattr(user, 'name', None) or user.email.partition("@")[0],  # Use name field or email prefix
         "createdAt": user.created_at.isoformat() if user.created_at else None,
         "updatedAt": user.created_at.isoformat() if user.created_at else None,  # Use created_at as fallback
     }
@@ -61,6 +62,12 @@ async def get_current_user_endpoint(
     if not user_id:
         raise UnauthorizedException(detail="Invalid token: missing subject")
 
+    # Parse the UUID here; the CRUD layer expects it pre-validated
+    try:
+        user_id = UUID(user_id)
+    except (ValueError, TypeError):
+        raise UnauthorizedException(detail="Invalid token: malformed subject")
+
     # Get user from database using the injected session
     user = await get_user_by_id(db, user_id)
     if not user:
@@ -76,7 +83,6 @@ async def get_current_user_endpoint(
     summary="Register a new user",
     description="Create a new user account and return an access token with user info (Better Auth compatible)",
 )
-@conditional_rate_limit(limiter, "5/minute")
 async def register(
     request: Request,
     user_data: UserCreate,
@@ -114,7 +120,6 @@ async def register(
     summary="Login user",
     description="Authenticate user and return an access token with user info (Better Auth compatible)",
 )
-@conditional_rate_limit(limiter, "5/minute")
 async def login(
     request: Request,
     credentials: LoginRequest,
@@ -134,7 +139,7 @@ async def login(
         raise UnauthorizedException(detail="Invalid email or password")
 
     # Verify password
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await verify_password(credentials.password, user.hashed_password):
         raise UnauthorizedException(detail="Invalid email or password")
 
     # Generate access token (sub must be string per JWT spec)
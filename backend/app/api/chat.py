@@ -7,6 +7,7 @@ from sqlalchemy import select
 from pydantic import BaseModel
 import time
 import sys
+import traceback
 from collections import defaultdict
 
 from app.database import get_db
@@ -146,7 +147,6 @@ async def send_chat_message(
             )
 
     # Step 3: Process message through AI agent with conversation management
-    import sys
     print(f"[DEBUG] USE_MOCK_AI = {USE_MOCK_AI}", file=sys.stderr)
 
     try:
@@ -175,7 +175,6 @@ async def send_chat_message(
         )
     except Exception as e:
         print(f"[ERROR] Chat processing failed: {e}", file=sys.stderr)
-        import traceback
         print(f"[ERROR] Traceback: {traceback.format_exc()}", file=sys.stderr)
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,905 @@
+"""Diagnostic and ad-hoc migration endpoints (non-production only).
+
+Schema checks, direct SQL helpers and one-off DDL, collected on their
+own router that main.py registers only outside production - Starlette
+matches routes linearly, so every mounted route adds per-request routing
+cost, and several of these run DDL or leak schema details. Imports are
+module-level so handlers don't re-resolve them on every call.
+"""
+import logging
+import os
+import traceback
+import uuid
+
+import orjson
+from fastapi import APIRouter, Header, Request, Response
+from sqlalchemy import text
+
+from app.config import settings
+from app.crud import task as task_crud
+from app.crud import user as user_crud
+from app.database import AsyncSessionLocal, copy_records_to_table, engine
+from app.schemas.task import TaskCreate
+from app.schemas.user import UserCreate
+from app.utils.security import hash_password
+
+logger = logging.getLogger(__name__)
+
+debug_router = APIRouter()
+
+# Statements reused across handlers, built once so each call skips
+# text() bind-parameter parsing and hits the compiled-statement cache
+# with a stable cache key
+_Q_SELECT_1 = text("SELECT 1")
+_Q_TABLES_EXIST = text(
+    "SELECT table_name FROM information_schema.tables "
+    "WHERE table_name = ANY(:names)"
+)
+_Q_COLUMNS_FOR_TABLE = text(
+    "SELECT column_name, data_type, is_nullable "
+    "FROM information_schema.columns "
+    "WHERE table_name = :table ORDER BY ordinal_position"
+)
+# Names-only variant for callers that just test membership - skips the
+# data_type/is_nullable columns they never read
+_Q_COLUMN_NAMES_FOR_TABLE = text(
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_name = :table"
+)
+_Q_ALEMBIC_VERSION = text("SELECT version_num FROM alembic_version")
+_Q_MESSAGES_COLUMNS = text(
+    "SELECT column_name, data_type, character_maximum_length "
+    "FROM information_schema.columns "
+    "WHERE table_name = 'messages' ORDER BY ordinal_position"
+)
+_Q_FIRST_USER_ID = text("SELECT id FROM users LIMIT 1")
+_Q_INSERT_TEST_CONVERSATION = text(
+    "INSERT INTO conversations (id, user_id, title, created_at, updated_at) "
+    "VALUES (:id, :user_id, :title, NOW(), NOW()) RETURNING id"
+)
+
+# Schema introspection only changes when a migration runs, so the
+# schema endpoints cache their serialized bodies keyed by
+# (table, alembic_version) and emit the version as an ETag. Polling
+# tools get 304s and repeat hits skip information_schema entirely;
+# force_migration clears the cache after rewriting the schema.
+_schema_cache: dict = {}
+
+
+def _schema_response(request: Request, etag: str, body: bytes) -> Response:
+    """Serve a cached schema body with ETag/Cache-Control, or a 304."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "max-age=60"},
+    )
+
+
+@debug_router.get("/debug/ai-config", tags=["Debug"])
+async def debug_ai_config():
+    """Debug endpoint to check AI configuration."""
+    return {
+        "groq_key_set": bool(os.getenv("GROQ_API_KEY")),
+        "gemini_key_set": bool(os.getenv("GEMINI_API_KEY")),
+        "openai_key_set": bool(os.getenv("OPENAI_API_KEY")),
+        "configured_model": settings.AI_MODEL,
+        "configured_base_url": settings.AI_BASE_URL,
+        "ai_api_key_first_chars": settings.AI_API_KEY[:10] if settings.AI_API_KEY else "NOT SET"
+    }
+
+@debug_router.get("/test-db", tags=["Test"])
+async def test_database():
+    """Test database connection."""
+    try:
+
+        async with engine.begin() as conn:
+            result = await conn.execute(_Q_SELECT_1)
+            return {"status": "database connected", "result": result.scalar()}
+    except Exception as e:
+        return {"status": "database error", "error": str(e)}
+
+@debug_router.get("/test-tables", tags=["Test"])
+async def test_tables():
+    """Test if database tables exist."""
+    try:
+
+        async with engine.begin() as conn:
+            # One round-trip for both tables instead of two EXISTS queries;
+            # bound ANY(:names) keeps a single prepared statement reusable
+            # for any table list
+            result = await conn.execute(
+                _Q_TABLES_EXIST, {"names": ["users", "tasks"]}
+            )
+            existing = {row[0] for row in result.fetchall()}
+
+            return {
+                "status": "tables checked",
+                "users_table": "users" in existing,
+                "tasks_table": "tasks" in existing
+            }
+    except Exception as e:
+        return {"status": "error checking tables", "error": str(e)}
+
+@debug_router.post("/test-register", tags=["Test"])
+async def test_register():
+    """Test user registration directly."""
+    try:
+
+        # Check what columns exist in users table.
+        # Open the session directly instead of hand-driving the get_db
+        # async generator (async for ... break), which drags the whole
+        # generator protocol through the handler
+        async with AsyncSessionLocal() as db:
+            # Stream rows through a server-side cursor instead of
+            # materializing the whole information_schema result at once;
+            # only the column names are kept
+            result = await db.stream(
+                _Q_COLUMN_NAMES_FOR_TABLE,
+                {"table": "users"},
+                execution_options={"yield_per": 50},
+            )
+            # frozenset gives O(1) membership checks below; scalars()
+            # skips per-row tuple unpacking since only names come back
+            column_names = frozenset([name async for name in result.scalars()])
+
+            # Check if hashed_password column exists
+            has_hashed_password = 'hashed_password' in column_names
+            has_preferences = 'preferences' in column_names
+
+            # Add missing columns in a single ALTER TABLE - one round-trip
+            # and one AccessExclusiveLock instead of one per column
+            columns_added = []
+
+            if not has_hashed_password or not has_preferences:
+                try:
+                    await db.execute(text("""
+                        ALTER TABLE users
+                        ADD COLUMN IF NOT EXISTS hashed_password VARCHAR(255),
+                        ADD COLUMN IF NOT EXISTS preferences JSONB
+                    """))
+                    if not has_hashed_password:
+                        columns_added.append("hashed_password")
+                    if not has_preferences:
+                        columns_added.append("preferences")
+                except Exception as alter_error:
+                    return {
+                        "status": "error",
+                        "message": f"Failed to add missing columns: {alter_error}",
+                        "existing_columns": column_names,
+                        "schema_issue": True
+                    }
+
+            # Check if id column is auto-incrementing
+            has_id = 'id' in column_names
+            if has_id:
+                # Create sequence + default in one server round-trip
+                try:
+                    await db.execute(text("""
+                        DO $$
+                        BEGIN
+                            CREATE SEQUENCE IF NOT EXISTS users_id_seq OWNED BY users.id;
+                            ALTER TABLE users ALTER COLUMN id SET DEFAULT nextval('users_id_seq');
+                        END
+                        $$
+                    """))
+                    columns_added.append("id sequence")
+                except Exception as seq_error:
+                    # Sequence might already exist or table might be empty
+                    pass
+
+            if columns_added:
+                await db.commit()
+                return {
+                    "status": "success",
+                    "message": f"Added columns to users table: {', '.join(columns_added)}",
+                    "columns_before": column_names,
+                    "columns_added": columns_added,
+                    "action": "Schema updated successfully"
+                }
+
+            # Create test user data
+            user_data = UserCreate(
+                email="test789@example.com",  # Use new email
+                password="testpass123"  # 8 characters minimum
+            )
+
+            # Check if user already exists
+            existing_user = await user_crud.get_user_by_email(db, user_data.email)
+            if existing_user:
+                return {
+                    "status": "error",
+                    "message": "User already exists",
+                    "user_id": existing_user.id,
+                    "columns": column_names,
+                    "has_hashed_password": has_hashed_password,
+                    "has_preferences": has_preferences
+                }
+
+            # Create user
+            user = await user_crud.create_user(db, user_data)
+
+            return {
+                "status": "success",
+                "user_id": user.id,
+                "email": user.email,
+                "columns": column_names,
+                "has_hashed_password": has_hashed_password,
+                "has_preferences": has_preferences,
+                "password_hashed": bool(user.hashed_password) if hasattr(user, 'hashed_password') else "N/A"
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/test-direct-user", tags=["Test"])
+async def test_direct_user():
+    """Test creating a user directly with SQL."""
+    try:
+
+        # Hash password
+        hashed = await hash_password("testpass123")
+
+        # Generate a UUID
+        user_id = str(uuid.uuid4())
+
+        # Insert user directly with SQL
+        async with engine.begin() as conn:
+            # Insert user with explicit UUID and all required fields
+            result = await conn.execute(text("""
+                INSERT INTO users (id, email, name, hashed_password, created_at)
+                VALUES (:id, :email, :name, :password, NOW())
+                RETURNING id
+            """), {"id": user_id, "email": "test456@example.com", "password": hashed, "name": "Test User"})
+
+            inserted_id = result.scalar()
+
+            # engine.begin() commits when the block exits - an explicit
+            # commit here is a redundant extra round-trip
+
+            return {
+                "status": "success",
+                "message": "User created successfully",
+                "user_id": inserted_id,
+                "email": "test456@example.com"
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.get("/test-schema", tags=["Test"])
+async def test_schema(request: Request):
+    """Check database schema."""
+    try:
+
+        async with engine.begin() as conn:
+            version = (await conn.execute(_Q_ALEMBIC_VERSION)).scalar() or "none"
+            etag = f'"{version}"'
+            body = _schema_cache.get(("users", version))
+            if body is None:
+                # Server-side cursor: rows arrive as they're produced instead
+                # of being buffered in full before the first byte
+                result = await conn.stream(
+                    _Q_COLUMNS_FOR_TABLE,
+                    {"table": "users"},
+                    execution_options={"yield_per": 50},
+                )
+                columns = [
+                    {"name": col[0], "type": col[1], "nullable": col[2]}
+                    async for col in result
+                ]
+                body = orjson.dumps({
+                    "status": "success",
+                    "table": "users",
+                    "columns": columns,
+                })
+                _schema_cache[("users", version)] = body
+
+        return _schema_response(request, etag, body)
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.get("/test-tasks-schema", tags=["Test"])
+async def test_tasks_schema(request: Request):
+    """Check tasks table schema."""
+    try:
+
+        async with engine.begin() as conn:
+            version = (await conn.execute(_Q_ALEMBIC_VERSION)).scalar() or "none"
+            etag = f'"{version}"'
+            body = _schema_cache.get(("tasks", version))
+            if body is None:
+                result = await conn.execute(text("""
+                    SELECT column_name, data_type, is_nullable, column_default
+                    FROM information_schema.columns
+                    WHERE table_name = 'tasks'
+                    ORDER BY ordinal_position
+                """))
+                columns = result.fetchall()
+                body = orjson.dumps({
+                    "status": "success",
+                    "table": "tasks",
+                    "columns": [
+                        {"name": col[0], "type": col[1], "nullable": col[2], "default": col[3]}
+                        for col in columns
+                    ],
+                })
+                _schema_cache[("tasks", version)] = body
+
+        return _schema_response(request, etag, body)
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.get("/test-priority-table", tags=["Test"])
+async def test_priority_table():
+    """Check if priority table exists."""
+    try:
+
+        async with engine.begin() as conn:
+            # One round-trip for both tables instead of two EXISTS queries
+            result = await conn.execute(
+                _Q_TABLES_EXIST, {"names": ["priorities", "task_priorities"]}
+            )
+            existing = {row[0] for row in result.fetchall()}
+
+            return {
+                "status": "success",
+                "priorities_table": "priorities" in existing,
+                "task_priorities_table": "task_priorities" in existing
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.get("/test-priorities-data", tags=["Test"])
+async def test_priorities_data():
+    """Check what's in the priorities table."""
+    try:
+
+        async with engine.begin() as conn:
+            result = await conn.execute(text("""
+                SELECT * FROM priorities ORDER BY id;
+            """))
+            # mappings() hands back RowMapping views that orjson can
+            # serialize directly - no per-row dict() materialization
+            rows = result.mappings().all()
+
+            return {
+                "status": "success",
+                "priorities": rows
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/test-create-priorities", tags=["Test"])
+async def test_create_priorities():
+    """Create default priorities if they don't exist."""
+    try:
+
+        async with engine.begin() as conn:
+            # Schema check and row count in a single round-trip
+            result = await conn.execute(text("""
+                SELECT column_name, data_type,
+                       (SELECT COUNT(*) FROM priorities) AS row_count
+                FROM information_schema.columns
+                WHERE table_name = 'priorities'
+                ORDER BY ordinal_position
+            """))
+            columns = result.fetchall()
+            count = columns[0][2] if columns else 0
+
+            if count == 0:
+                # Seed default priorities via COPY - binary protocol,
+                # no per-row parse/plan
+                await copy_records_to_table(
+                    'priorities',
+                    records=[
+                        (1, 'Low', 1, '#28a745'),
+                        (2, 'Medium', 2, '#ffc107'),
+                        (3, 'High', 3, '#dc3545'),
+                    ],
+                    columns=['id', 'name', 'level', 'color'],
+                )
+                return {
+                    "status": "success",
+                    "message": "Default priorities created",
+                    "columns": [{"name": col[0], "type": col[1]} for col in columns]
+                }
+            else:
+                return {
+                    "status": "success",
+                    "message": f"Priorities already exist ({count} rows)",
+                    "columns": [{"name": col[0], "type": col[1]} for col in columns]
+                }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/test-create-task", tags=["Test"])
+async def test_create_task_direct():
+    """Test creating a task directly with SQL."""
+    try:
+
+        async with engine.begin() as conn:
+            # Get an existing user
+            result = await conn.execute(_Q_FIRST_USER_ID)
+            user_row = result.scalar_one_or_none()
+
+            if not user_row:
+                return {"status": "error", "message": "No users found"}
+
+            user_uuid = str(user_row)
+
+            # Insert task
+            result2 = await conn.execute(text("""
+                INSERT INTO tasks (user_id, title, description, priority_id, completed, created_at, updated_at)
+                VALUES (:user_id, :title, :description, :priority_id, false, NOW(), NOW())
+                RETURNING id
+            """), {"user_id": user_uuid, "title": "Test Task", "description": "Test Description", "priority_id": 2})
+
+            task_id = result2.scalar()
+
+
+            return {
+                "status": "success",
+                "message": "Task created successfully",
+                "user_id": user_uuid,
+                "task_id": task_id
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/test-create-task-crud", tags=["Test"])
+async def test_create_task_crud():
+    """Test creating a task via CRUD operations."""
+    try:
+
+        async with AsyncSessionLocal() as db:
+            # Get an existing user
+            result = await db.execute(_Q_FIRST_USER_ID)
+            user_row = result.scalar_one_or_none()
+
+            if not user_row:
+                return {"status": "error", "message": "No users found"}
+
+            user_uuid = str(user_row)
+
+            # Create task data
+            task_data = TaskCreate(
+                title="Test CRUD Task",
+                description="Testing CRUD task creation",
+                priority_id=2
+            )
+
+            # Create task via CRUD
+            task = await task_crud.create_task(db, task_data, user_uuid)
+
+            return {
+                "status": "success",
+                "message": "Task created successfully via CRUD",
+                "task_id": task.id,
+                "priority_obj": task.priority_obj.name if task.priority_obj else None
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.get("/test-auth", tags=["Test"])
+async def test_auth(authorization: str = Header(None)):
+    """Test authentication flow"""
+    return {
+        "authorization": authorization,
+        "has_auth": authorization is not None,
+        "auth_length": len(authorization) if authorization else 0
+    }
+
+
+@debug_router.post("/force-migration", tags=["Emergency"])
+async def force_migration():
+    """EMERGENCY: Force run the UUID migration for conversations and messages tables."""
+    try:
+
+        async with engine.begin() as conn:
+            # Check current migration state
+            result = await conn.execute(text("""
+                SELECT version_num FROM alembic_version
+            """))
+            current_version = result.scalar()
+
+            logger.info("Current Alembic version: %s", current_version)
+
+            # Check if conversations table exists and what type its id column is
+            result = await conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'conversations'
+                )
+            """))
+            conversations_exist = result.scalar()
+
+            if conversations_exist:
+                result = await conn.execute(text("""
+                    SELECT data_type
+                    FROM information_schema.columns
+                    WHERE table_name = 'conversations' AND column_name = 'id'
+                """))
+                id_type = result.scalar()
+                logger.info("Conversations table exists with id type: %s", id_type)
+
+                # If it's still integer, we need to run the migration
+                if id_type == 'integer':
+                    logger.info("Running UUID migration for conversations and messages...")
+
+                    # Drop the tables and recreate with UUID columns
+                    await conn.execute(text('DROP TABLE IF EXISTS messages CASCADE'))
+                    await conn.execute(text('DROP TABLE IF EXISTS conversations CASCADE'))
+
+                    # Recreate conversations table with UUID columns
+                    await conn.execute(text("""
+                        CREATE TABLE conversations (
+                            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                            title VARCHAR(200) NOT NULL DEFAULT 'New Conversation',
+                            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                            updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+                        )
+                    """))
+
+                    # Create index for performance
+                    await conn.execute(text("""
+                        CREATE INDEX idx_conversations_created_at_desc
+                        ON conversations (created_at DESC)
+                    """))
+
+                    # Recreate messages table with UUID columns
+                    await conn.execute(text("""
+                        CREATE TABLE messages (
+                            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                            conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+                            role VARCHAR(20) NOT NULL CHECK (role IN ('user', 'assistant', 'system', 'tool')),
+                            content TEXT NOT NULL,
+                            tool_calls JSONB,
+                            tool_call_id VARCHAR(100),
+                            name VARCHAR(100),
+                            created_at TIMESTAMP NOT NULL DEFAULT NOW()
+                        )
+                    """))
+
+                    # Create index for performance
+                    await conn.execute(text("""
+                        CREATE INDEX idx_messages_conversation_created
+                        ON messages (conversation_id, created_at)
+                    """))
+
+                    # Update alembic version to mark this migration as applied
+                    await conn.execute(text("""
+                        UPDATE alembic_version SET version_num = 'e940f362bb65'
+                    """))
+
+
+                    logger.info("UUID migration completed successfully!")
+
+                    # Schema changed - drop cached schema responses
+                    _schema_cache.clear()
+
+                    return {
+                        "status": "success",
+                        "message": "UUID migration applied successfully",
+                        "previous_version": current_version,
+                        "new_version": "e940f362bb65",
+                        "action": "Tables recreated with UUID columns"
+                    }
+                else:
+                    logger.info("Conversations table already has UUID columns")
+                    return {
+                        "status": "success",
+                        "message": "UUID columns already exist",
+                        "current_version": current_version,
+                        "id_type": id_type
+                    }
+            else:
+                # Tables don't exist, mark migration as applied
+                await conn.execute(text("""
+                    UPDATE alembic_version SET version_num = 'e940f362bb65'
+                """))
+
+                # Version row changed - cached schema bodies are keyed by it
+                _schema_cache.clear()
+
+                return {
+                    "status": "success",
+                    "message": "Tables don't exist, migration marked as applied",
+                    "current_version": current_version
+                }
+
+    except Exception as e:
+        # exc_info defers traceback formatting to the handler
+        logger.error("Migration failed: %s", e, exc_info=True)
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/check-conversation-schema", tags=["Test"])
+async def check_conversation_schema():
+    """Check if conversations and messages tables have correct UUID schema."""
+    try:
+
+        async with engine.begin() as conn:
+            # Check conversations table
+            result = await conn.execute(text("""
+                SELECT column_name, data_type, is_nullable, column_default
+                FROM information_schema.columns
+                WHERE table_name = 'conversations'
+                ORDER BY ordinal_position
+            """))
+            conv_columns = result.fetchall()
+
+            # Check messages table
+            result = await conn.execute(text("""
+                SELECT column_name, data_type, is_nullable, column_default
+                FROM information_schema.columns
+                WHERE table_name = 'messages'
+                ORDER BY ordinal_position
+            """))
+            msg_columns = result.fetchall()
+
+            # Check alembic version
+            result = await conn.execute(text("""
+                SELECT version_num FROM alembic_version
+            """))
+            alembic_version = result.scalar()
+
+            return {
+                "status": "success",
+                "alembic_version": alembic_version,
+                "conversations_table": [
+                    {
+                        "name": col[0],
+                        "type": col[1],
+                        "nullable": col[2],
+                        "default": col[3]
+                    }
+                    for col in conv_columns
+                ],
+                "messages_table": [
+                    {
+                        "name": col[0],
+                        "type": col[1],
+                        "nullable": col[2],
+                        "default": col[3]
+                    }
+                    for col in msg_columns
+                ]
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+# Messages-column metadata only changes on deploy or when
+# add_tool_columns runs its DDL, so it is loaded once (at startup via
+# prime_messages_columns, or lazily on first hit) and served from
+# memory after that. Dashboard polls of check-messages-columns then
+# never touch Postgres; add_tool_columns and the refresh endpoint
+# below invalidate/reload explicitly.
+_MESSAGES_COLUMNS_CACHE: list | None = None
+
+
+async def _load_messages_columns(conn) -> list:
+    """Fetch and parse the messages table's column metadata."""
+    result = await conn.execute(_Q_MESSAGES_COLUMNS)
+    return [
+        {
+            "name": row[0],
+            "type": row[1],
+            "max_length": row[2]
+        }
+        for row in result.fetchall()
+    ]
+
+
+async def prime_messages_columns() -> None:
+    """Load the messages-column cache once; called from app startup."""
+    global _MESSAGES_COLUMNS_CACHE
+    async with engine.begin() as conn:
+        _MESSAGES_COLUMNS_CACHE = await _load_messages_columns(conn)
+
+
+def _messages_columns_status(columns: list) -> dict:
+    """Build the check-messages-columns response body."""
+    has_tool_call_id = any(col["name"] == "tool_call_id" for col in columns)
+    has_name = any(col["name"] == "name" for col in columns)
+    return {
+        "status": "success",
+        "columns": columns,
+        "has_tool_call_id": has_tool_call_id,
+        "has_name": has_name,
+        "ready_for_chat": has_tool_call_id and has_name
+    }
+
+
+@debug_router.get("/check-messages-columns", tags=["Migration"])
+async def check_messages_columns():
+    """Check what columns exist in the messages table."""
+    try:
+
+        columns = _MESSAGES_COLUMNS_CACHE
+        if columns is None:
+            # Startup priming failed or was skipped - load lazily once
+            await prime_messages_columns()
+            columns = _MESSAGES_COLUMNS_CACHE
+
+        return _messages_columns_status(columns)
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/refresh-messages-columns", tags=["Migration"])
+async def refresh_messages_columns():
+    """Re-read messages-column metadata after an out-of-band schema change."""
+    try:
+        await prime_messages_columns()
+        return _messages_columns_status(_MESSAGES_COLUMNS_CACHE)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+# Once both tool columns are confirmed present, add_tool_columns is a
+# no-op - remember that per process and skip the catalog SELECT (and
+# any SQL at all) on repeat calls
+_TOOL_COLUMNS_READY: bool = False
+
+
+@debug_router.post("/add-tool-columns", tags=["Migration"])
+async def add_tool_columns():
+    """Add missing tool_call_id and name columns to messages table."""
+    global _MESSAGES_COLUMNS_CACHE, _TOOL_COLUMNS_READY
+    if _TOOL_COLUMNS_READY:
+        return {
+            "status": "success",
+            "message": "All columns already exist",
+            "columns_added": []
+        }
+    try:
+
+        async with engine.begin() as conn:
+            # One idempotent DDL statement replaces the previous
+            # information_schema lookup plus two conditional ALTERs -
+            # three round-trips collapse into one
+            await conn.execute(text("""
+                ALTER TABLE messages
+                ADD COLUMN IF NOT EXISTS tool_call_id VARCHAR(100),
+                ADD COLUMN IF NOT EXISTS name VARCHAR(100)
+            """))
+            logger.info("Ensured tool_call_id and name columns on messages table")
+
+        # Both columns now exist - short-circuit future calls and drop
+        # the cached column list in case the DDL changed it
+        _TOOL_COLUMNS_READY = True
+        _MESSAGES_COLUMNS_CACHE = None
+
+        return {
+            "status": "success",
+            "message": "Columns ensured",
+            "columns_added": []
+        }
+
+    except Exception as e:
+        # exc_info defers traceback formatting to the handler
+        logger.error("Failed to add columns: %s", e, exc_info=True)
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
+@debug_router.post("/test-conversation-creation", tags=["Test"])
+async def test_conversation_creation():
+    """Test creating a conversation to verify UUID schema works."""
+    try:
+
+        async with engine.begin() as conn:
+            # Get a user ID
+            result = await conn.execute(_Q_FIRST_USER_ID)
+            user_row = result.scalar_one_or_none()
+
+            if not user_row:
+                return {"status": "error", "message": "No users found"}
+
+            # Bind uuid.UUID objects directly: asyncpg encodes them in
+            # binary, so Postgres skips the text -> uuid cast per
+            # parameter it paid when these were str()'d first
+            conversation_id = uuid.uuid4()
+
+            # Try to insert a conversation with UUID
+            result = await conn.execute(_Q_INSERT_TEST_CONVERSATION, {
+                "id": conversation_id,
+                "user_id": user_row,
+                "title": "Test Conversation"
+            })
+
+            inserted_id = result.scalar()
+
+
+            return {
+                "status": "success",
+                "message": "Conversation created successfully with UUID",
+                "conversation_id": str(inserted_id),
+                "user_id": str(user_row)
+            }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+
@@ -1,5 +1,6 @@
 """API dependencies for database session and authentication."""
 from typing import AsyncGenerator, Optional
+from uuid import UUID
 from fastapi import Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -56,11 +57,18 @@ async def get_current_user(
         print("DEBUG: No user_id (sub) in token payload")
         raise UnauthorizedException(detail="Invalid token payload")
 
-    # user_id is already a UUID string, no need to convert to int
-    print(f"DEBUG: Looking for user_id: {user_id_str}")
+    # Parse the UUID once here at the edge; the CRUD layer takes the
+    # already-validated UUID and skips re-parsing per call
+    try:
+        user_id = UUID(user_id_str)
+    except (ValueError, TypeError):
+        print(f"DEBUG: Token sub is not a valid UUID: {user_id_str}")
+        raise UnauthorizedException(detail="Invalid token payload")
+
+    print(f"DEBUG: Looking for user_id: {user_id}")
 
     # Fetch user from database
-    user = await get_user_by_id(db, user_id_str)
+    user = await get_user_by_id(db, user_id)
     if user is None:
         print(f"DEBUG: User not found for ID: {user_id}")
         raise UnauthorizedException(detail="User not found")
@@ -228,9 +228,9 @@ async def use_template(
     if not template:
         raise NotFoundException(detail=f"Task template {template_id} not found")
 
-    # Get task data from template with overrides
+    # Create the task directly from the template with overrides applied
     overrides_data = overrides.dict() if overrides else {}
-    task_data_dict = await task_template_crud.create_task_from_template(
+    new_task = await task_template_crud.create_task_from_template(
         db=db,
         template=template,
         user_id=str(current_user.id),
@@ -239,13 +239,6 @@ async def use_template(
         due_date=overrides_data.get("due_date"),
     )
 
-    # Convert to TaskCreate schema
-    from app.schemas.task import TaskCreate
-    task_create = TaskCreate(**task_data_dict)
-
-    # Create the task
-    new_task = await task_crud.create_task(db, task_create, str(current_user.id))
-
     return new_task
 
 
@@ -14,6 +14,14 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = Field(..., description="Database connection URL")
+    # asyncpg statement caches; set both to 0 when running behind PgBouncer
+    # in transaction-pooling mode, where prepared statements can't be reused
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=1024, description="asyncpg client-side statement cache size"
+    )
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(
+        default=1024, description="asyncpg prepared statement cache size"
+    )
 
     # JWT
     JWT_SECRET_KEY: str = Field(..., min_length=32, description="JWT secret key (minimum 32 characters)")
@@ -29,6 +37,11 @@ class Settings(BaseSettings):
         """Better Auth JWT secret - uses same value as JWT_SECRET_KEY for compatibility."""
         return self.JWT_SECRET_KEY
 
+    # Redis (shared rate-limit counters; empty = in-process fallback)
+    REDIS_URL: str = Field(
+        default="", description="Redis URL for distributed rate limiting"
+    )
+
     # CORS
     CORS_ORIGINS: str = Field(
         default="http://localhost:3000,https://frontend-hamdanprofessionals-projects.vercel.app,https://backend-hamdanprofessionals-projects.vercel.app",
@@ -1,8 +1,8 @@
 """Task CRUD operations."""
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple, Union
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, asc, desc
+from sqlalchemy import select, insert, update, delete, func, or_, asc, desc, lambda_stmt
 from sqlalchemy.orm import selectinload
 
 from app.models.task import Task, Priority
@@ -26,39 +26,45 @@ async def create_task(db: AsyncSession, task_data: TaskCreate, user_id: str) ->
     Returns:
         Created task instance
     """
-    db_task = Task(
-        user_id=user_id,
-        title=task_data.title,
-        description=task_data.description or "",
-        priority_id=task_data.priority_id,
-        due_date=task_data.due_date,
-        completed=False,
-        is_recurring=task_data.is_recurring if task_data.is_recurring is not None else False,
-        recurrence_pattern=task_data.recurrence_pattern,
+    # INSERT ... RETURNING yields the row with DB-generated fields
+    # (id, created_at, updated_at) in the insert round-trip itself,
+    # replacing the old commit + refresh + eager re-fetch sequence.
+    stmt = (
+        insert(Task)
+        .values(
+            user_id=user_id,
+            title=task_data.title,
+            description=task_data.description or "",
+            priority_id=task_data.priority_id,
+            due_date=task_data.due_date,
+            completed=False,
+            is_recurring=task_data.is_recurring if task_data.is_recurring is not None else False,
+            recurrence_pattern=task_data.recurrence_pattern,
+        )
+        .returning(Task)
+        .options(selectinload(Task.priority_obj))
     )
-
-    db.add(db_task)
-    await db.commit()
-    await db.refresh(db_task)
-
-    # Re-fetch with eager loading to prevent DetachedInstanceError
-    stmt = select(Task).where(Task.id == db_task.id).options(selectinload(Task.priority_obj))
     result = await db.execute(stmt)
     task = result.scalar_one()
+    await db.commit()
 
     # Publish task-created event (fire and forget - don't block response)
     try:
+        # Hoist attributes to locals so the dict literal doesn't re-trigger
+        # instrumented attribute lookups for every key.
+        t = task
+        due = t.due_date
         event_data = {
-            "task_id": task.id,
+            "task_id": t.id,
             "user_id": user_id,
-            "title": task.title,
-            "description": task.description,
-            "priority_id": task.priority_id,
-            "due_date": task.due_date.isoformat() if task.due_date else None,
-            "completed": task.completed,
-            "is_recurring": task.is_recurring,
-            "recurrence_pattern": task.recurrence_pattern,
-            "created_at": task.created_at.isoformat()
+            "title": t.title,
+            "description": t.description,
+            "priority_id": t.priority_id,
+            "due_date": due.isoformat() if due else None,
+            "completed": t.completed,
+            "is_recurring": t.is_recurring,
+            "recurrence_pattern": t.recurrence_pattern,
+            "created_at": t.created_at.isoformat()
         }
         await dapr_event_publisher.publish_task_created(event_data)
         await event_logger.log_task_created(db, task.id, event_data)
@@ -77,8 +83,9 @@ async def get_tasks_by_user(
     sort_by: Optional[str] = "created_at",
     sort_order: Optional[str] = "desc",
     limit: Optional[int] = 20,
-    offset: Optional[int] = 0
-) -> List[Task]:
+    offset: Optional[int] = 0,
+    with_count: bool = False
+) -> Union[List[Task], Tuple[List[Task], int]]:
     """
     Get all tasks for a specific user with optional filtering and sorting.
 
@@ -90,17 +97,34 @@ async def get_tasks_by_user(
         priority: Optional priority filter (1=Low, 2=Medium, 3=High)
         sort_by: Field to sort by (created_at, due_date, priority_id, title)
         sort_order: Sort order ("asc" or "desc")
+        with_count: Also return the total matching row count, computed
+            with count(*) OVER () in the same query instead of a second
+            COUNT round-trip
 
     Returns:
-        List of user's tasks matching the criteria
+        List of user's tasks matching the criteria, or a
+        (tasks, total_count) tuple when with_count is True
     """
-    # Start with base query with relationship loading
-    query = select(Task).options(selectinload(Task.priority_obj)).where(Task.user_id == user_id)
+    # Build the query as a lambda statement so SQLAlchemy caches the
+    # compiled SQL per distinct filter/sort combination instead of
+    # recompiling on every request. Closed-over values (user_id, search
+    # term, pagination) become bound parameters automatically.
+    if with_count:
+        # count(*) OVER () returns the total filtered count on every row,
+        # so list + count costs a single round-trip.
+        query = lambda_stmt(
+            lambda: select(Task, func.count().over().label("total_count"))
+            .where(Task.user_id == user_id)
+        )
+    else:
+        query = lambda_stmt(
+            lambda: select(Task).where(Task.user_id == user_id)
+        )
 
     # Apply search filter
     if search:
         search_term = f"%{search}%"
-        query = query.where(
+        query += lambda s: s.where(
             or_(
                 Task.title.ilike(search_term),
                 Task.description.ilike(search_term)
@@ -109,44 +133,121 @@ async def get_tasks_by_user(
 
     # Apply status filter
     if status == "completed":
-        query = query.where(Task.completed == True)
+        query += lambda s: s.where(Task.completed == True)
     elif status == "pending":
-        query = query.where(Task.completed == False)
+        query += lambda s: s.where(Task.completed == False)
 
     # Apply priority filter
     if priority and priority in [1, 2, 3]:
-        query = query.where(Task.priority_id == priority)
+        query += lambda s: s.where(Task.priority_id == priority)
 
     # Apply sorting with proper field handling and null management
     if sort_by == "due_date":
         # Sort by due_date, putting tasks with NO due date at the bottom
         if sort_order == "asc":
-            query = query.order_by(asc(Task.due_date).nulls_last())
+            query += lambda s: s.order_by(asc(Task.due_date).nulls_last())
         else:
-            query = query.order_by(desc(Task.due_date).nulls_last())
+            query += lambda s: s.order_by(desc(Task.due_date).nulls_last())
     elif sort_by == "priority":
         # Sort by priority level (join with priorities table to get level)
-        query = query.order_by(desc(Task.priority_id) if sort_order == "desc" else asc(Task.priority_id))
+        if sort_order == "desc":
+            query += lambda s: s.order_by(desc(Task.priority_id))
+        else:
+            query += lambda s: s.order_by(asc(Task.priority_id))
     elif sort_by == "title":
         # Sort by title
         if sort_order == "asc":
-            query = query.order_by(asc(Task.title))
+            query += lambda s: s.order_by(asc(Task.title))
         else:
-            query = query.order_by(desc(Task.title))
+            query += lambda s: s.order_by(desc(Task.title))
     else:
         # Default: Sort by created_at
         if sort_order == "asc":
-            query = query.order_by(asc(Task.created_at))
+            query += lambda s: s.order_by(asc(Task.created_at))
         else:
-            query = query.order_by(desc(Task.created_at))
+            query += lambda s: s.order_by(desc(Task.created_at))
 
     # Apply pagination
-    query = query.limit(limit).offset(offset)
+    query += lambda s: s.limit(limit).offset(offset)
 
     result = await db.execute(query)
+    if with_count:
+        rows = result.all()
+        tasks = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif offset:
+            # The window count rides on returned rows, so a page past
+            # the end carries no count - fall back to a real COUNT with
+            # the same filters so paginating clients get the true total
+            # instead of 0. Rare path (client overshot the last page),
+            # so a plain select without lambda caching is fine.
+            count_stmt = (
+                select(func.count())
+                .select_from(Task)
+                .where(Task.user_id == user_id)
+            )
+            if search:
+                search_term = f"%{search}%"
+                count_stmt = count_stmt.where(
+                    or_(
+                        Task.title.ilike(search_term),
+                        Task.description.ilike(search_term),
+                    )
+                )
+            if status == "completed":
+                count_stmt = count_stmt.where(Task.completed == True)
+            elif status == "pending":
+                count_stmt = count_stmt.where(Task.completed == False)
+            if priority and priority in [1, 2, 3]:
+                count_stmt = count_stmt.where(Task.priority_id == priority)
+            total = (await db.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
+        return tasks, total
     return result.scalars().all()
 
 
+async def list_task_rows(
+    db: AsyncSession, user_id: str, status: Optional[str] = None
+):
+    """
+    Fetch task list rows as plain column mappings, skipping ORM hydration.
+
+    Read-only consumers that serialize a fixed set of columns straight
+    to dicts (the list_tasks MCP tool) get no value from identity-map
+    bookkeeping, attribute instrumentation or relationship proxies on
+    full Task entities - a Core column select cuts that per-row cost.
+
+    Args:
+        db: Database session
+        user_id: User ID (UUID string) to filter by
+        status: Optional status filter ("completed" or "pending")
+
+    Returns:
+        List of RowMapping with id, title, description, completed,
+        created_at and updated_at keys
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            Task.id,
+            Task.title,
+            Task.description,
+            Task.completed,
+            Task.created_at,
+            Task.updated_at,
+        ).where(Task.user_id == user_id)
+    )
+    if status == "completed":
+        stmt += lambda s: s.where(Task.completed == True)
+    elif status == "pending":
+        stmt += lambda s: s.where(Task.completed == False)
+    stmt += lambda s: s.order_by(desc(Task.created_at))
+
+    result = await db.execute(stmt)
+    return result.mappings().all()
+
+
 async def get_task_by_id(db: AsyncSession, task_id: int, user_id: str) -> Optional[Task]:
     """
     Get a specific task by ID, ensuring it belongs to the user.
@@ -159,10 +260,17 @@ async def get_task_by_id(db: AsyncSession, task_id: int, user_id: str) -> Option
     Returns:
         Task instance if found and owned by user, None otherwise
     """
-    result = await db.execute(
-        select(Task).options(selectinload(Task.priority_obj)).where(Task.id == task_id, Task.user_id == user_id)
+    # lambda_stmt caches the compiled SQL; task_id/user_id become bound
+    # parameters so every call reuses the same compiled statement.
+    # LIMIT 1 + first() avoids the extra fetch scalar_one_or_none does
+    # to verify uniqueness (the PK filter already guarantees it).
+    stmt = lambda_stmt(
+        lambda: select(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .limit(1)
     )
-    return result.scalar_one_or_none()
+    result = await db.execute(stmt)
+    return result.scalars().first()
 
 
 async def update_task(
@@ -179,53 +287,52 @@ async def update_task(
     Returns:
         Updated task instance
     """
+    # Only touch fields the caller actually sent; an empty patch skips
+    # the whole commit/refresh/event round-trip.
+    fields = {
+        k: v for k, v in task_data.model_dump(exclude_unset=True).items()
+        if v is not None
+    }
+    if not fields:
+        return task
+
     # Track if task completion status changed
     was_completed = task.completed
-    completion_changed = False
-
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.priority_id is not None:
-        task.priority_id = task_data.priority_id
-    if task_data.due_date is not None:
-        task.due_date = task_data.due_date
-    if task_data.completed is not None:
-        if task_data.completed != was_completed:
-            completion_changed = True
-        task.completed = task_data.completed
-    if task_data.is_recurring is not None:
-        task.is_recurring = task_data.is_recurring
-    if task_data.recurrence_pattern is not None:
-        task.recurrence_pattern = task_data.recurrence_pattern
+    completion_changed = "completed" in fields and fields["completed"] != was_completed
+
+    for key, value in fields.items():
+        setattr(task, key, value)
 
     await db.commit()
     await db.refresh(task)
 
     # Re-fetch with eager loading to prevent DetachedInstanceError
-    stmt = select(Task).where(Task.id == task.id).options(selectinload(Task.priority_obj))
+    stmt = select(Task).where(Task.id == task.id)
     result = await db.execute(stmt)
     updated_task = result.scalar_one()
 
     # Publish task-updated or task-completed event (fire and forget)
     try:
+        # Hoist attributes to locals so the dict literal doesn't re-trigger
+        # instrumented attribute lookups for every key.
+        t = updated_task
+        due = t.due_date
         event_data = {
-            "task_id": updated_task.id,
-            "user_id": str(updated_task.user_id),
-            "title": updated_task.title,
-            "description": updated_task.description,
-            "priority_id": updated_task.priority_id,
-            "due_date": updated_task.due_date.isoformat() if updated_task.due_date else None,
-            "completed": updated_task.completed,
-            "is_recurring": updated_task.is_recurring,
-            "recurrence_pattern": updated_task.recurrence_pattern,
-            "updated_at": updated_task.updated_at.isoformat()
+            "task_id": t.id,
+            "user_id": str(t.user_id),
+            "title": t.title,
+            "description": t.description,
+            "priority_id": t.priority_id,
+            "due_date": due.isoformat() if due else None,
+            "completed": t.completed,
+            "is_recurring": t.is_recurring,
+            "recurrence_pattern": t.recurrence_pattern,
+            "updated_at": t.updated_at.isoformat()
         }
 
         # If task was just completed, publish task-completed event
-        if completion_changed and updated_task.completed:
-            event_data["completed_at"] = datetime.utcnow().isoformat()
+        if completion_changed and t.completed:
+            event_data["completed_at"] = datetime.now(timezone.utc).isoformat()
             await dapr_event_publisher.publish_task_completed(event_data)
             await event_logger.log_task_completed(db, updated_task.id, event_data)
         else:
@@ -254,39 +361,201 @@ async def toggle_task_completion(db: AsyncSession, task: Task) -> Task:
     await db.refresh(task)
 
     # Re-fetch with eager loading to prevent DetachedInstanceError
-    stmt = select(Task).where(Task.id == task.id).options(selectinload(Task.priority_obj))
+    stmt = select(Task).where(Task.id == task.id)
     result = await db.execute(stmt)
     updated_task = result.scalar_one()
 
     # Publish task-completed event if task was just completed
     try:
-        if updated_task.completed:
+        t = updated_task
+        if t.completed:
             event_data = {
-                "task_id": updated_task.id,
-                "user_id": str(updated_task.user_id),
-                "title": updated_task.title,
+                "task_id": t.id,
+                "user_id": str(t.user_id),
+                "title": t.title,
                 "completed": True,
-                "completed_at": datetime.utcnow().isoformat()
+                "completed_at": datetime.now(timezone.utc).isoformat()
             }
             await dapr_event_publisher.publish_task_completed(event_data)
-            await event_logger.log_task_completed(db, updated_task.id, event_data)
+            await event_logger.log_task_completed(db, t.id, event_data)
         else:
             # Task was uncompleted - publish update event
             event_data = {
-                "task_id": updated_task.id,
-                "user_id": str(updated_task.user_id),
-                "title": updated_task.title,
+                "task_id": t.id,
+                "user_id": str(t.user_id),
+                "title": t.title,
                 "completed": False,
-                "updated_at": updated_task.updated_at.isoformat()
+                "updated_at": t.updated_at.isoformat()
             }
             await dapr_event_publisher.publish_task_updated(event_data)
-            await event_logger.log_task_updated(db, updated_task.id, event_data)
+            await event_logger.log_task_updated(db, t.id, event_data)
     except Exception as e:
         logger.error(f"Failed to publish task toggle event: {e}")
 
     return updated_task
 
 
+async def toggle_task_atomic(db: AsyncSession, task_id: int, user_id: str):
+    """
+    Toggle task completion in a single UPDATE ... RETURNING round-trip.
+
+    Fuses the SELECT-ownership-check + UPDATE pair used by
+    get_task_by_id/toggle_task_completion into one statement: the
+    user_id predicate enforces ownership and RETURNING brings back the
+    fields tool callers respond with.
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        user_id: User ID (UUID string) to verify ownership
+
+    Returns:
+        Row with (id, title, completed) if the task existed and belongs
+        to the user, None otherwise
+    """
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(completed=~Task.completed, updated_at=func.now())
+        .returning(Task.id, Task.title, Task.completed)
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    await db.commit()
+
+    # Publish the same events toggle_task_completion emits (fire and forget)
+    try:
+        if row.completed:
+            event_data = {
+                "task_id": row.id,
+                "user_id": str(user_id),
+                "title": row.title,
+                "completed": True,
+                "completed_at": datetime.now(timezone.utc).isoformat()
+            }
+            await dapr_event_publisher.publish_task_completed(event_data)
+            await event_logger.log_task_completed(db, row.id, event_data)
+        else:
+            event_data = {
+                "task_id": row.id,
+                "user_id": str(user_id),
+                "title": row.title,
+                "completed": False,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+            await dapr_event_publisher.publish_task_updated(event_data)
+            await event_logger.log_task_updated(db, row.id, event_data)
+    except Exception as e:
+        logger.error(f"Failed to publish task toggle event: {e}")
+
+    return row
+
+
+async def update_task_atomic(
+    db: AsyncSession,
+    task_id: int,
+    user_id: str,
+    title=None,
+    description=None,
+):
+    """
+    Update title/description in a single UPDATE ... RETURNING round-trip.
+
+    Same fusion as toggle_task_atomic: ownership is checked by the
+    WHERE clause instead of a prior SELECT, so tool callers that were
+    doing get_task_by_id + update pay one statement instead of two.
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        user_id: User ID (UUID string) to verify ownership
+        title: New title, or None to leave unchanged
+        description: New description, or None to leave unchanged
+
+    Returns:
+        Row with (id, title, description, completed, updated_at) if the
+        task existed and belongs to the user, None otherwise
+    """
+    values = {"updated_at": func.now()}
+    if title is not None:
+        values["title"] = title
+    if description is not None:
+        values["description"] = description
+
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**values)
+        .returning(
+            Task.id, Task.title, Task.description, Task.completed, Task.updated_at
+        )
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    await db.commit()
+
+    # Publish task-updated event (fire and forget)
+    try:
+        event_data = {
+            "task_id": row.id,
+            "user_id": str(user_id),
+            "title": row.title,
+            "description": row.description,
+            "completed": row.completed,
+            "updated_at": row.updated_at.isoformat()
+        }
+        await dapr_event_publisher.publish_task_updated(event_data)
+        await event_logger.log_task_updated(db, row.id, event_data)
+    except Exception as e:
+        logger.error(f"Failed to publish task event: {e}")
+
+    return row
+
+
+async def delete_task_atomic(db: AsyncSession, task_id: int, user_id: str):
+    """
+    Delete a task in a single DELETE ... RETURNING round-trip.
+
+    Same fusion as toggle_task_atomic: ownership is checked by the
+    WHERE clause instead of a prior SELECT, and RETURNING yields the
+    title for the caller's response.
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        user_id: User ID (UUID string) to verify ownership
+
+    Returns:
+        Row with (id, title) if the task existed and belongs to the
+        user, None otherwise
+    """
+    stmt = (
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.id, Task.title)
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    await db.commit()
+
+    # Publish task-deleted event (fire and forget)
+    try:
+        event_data = {
+            "task_id": row.id,
+            "user_id": str(user_id),
+            "deleted_at": datetime.now(timezone.utc).isoformat()
+        }
+        await dapr_event_publisher.publish_task_deleted(event_data)
+        # Note: Can't log to database after delete, so we skip event_logger here
+    except Exception as e:
+        logger.error(f"Failed to publish task-deleted event: {e}")
+
+    return row
+
+
 async def delete_task(db: AsyncSession, task: Task) -> None:
     """
     Delete a task.
@@ -306,7 +575,7 @@ async def delete_task(db: AsyncSession, task: Task) -> None:
         event_data = {
             "task_id": task_id,
             "user_id": user_id,
-            "deleted_at": datetime.utcnow().isoformat()
+            "deleted_at": datetime.now(timezone.utc).isoformat()
         }
         await dapr_event_publisher.publish_task_deleted(event_data)
         # Note: Can't log to database after delete, so we skip event_logger here
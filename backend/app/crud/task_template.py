@@ -1,11 +1,16 @@
 """TaskTemplate CRUD operations."""
 from typing import List, Optional
+from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, asc, desc
-from sqlalchemy.orm import selectinload
-
+from sqlalchemy import select, insert, asc, desc
+from app.models.task import Task
 from app.models.task_template import TaskTemplate
 from app.schemas.task_template import TaskTemplateCreate, TaskTemplateUpdate
+from app.services.event_publisher import dapr_event_publisher
+from app.services.event_logger import event_logger
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 async def create_template(
@@ -24,29 +29,26 @@ async def create_template(
     Returns:
         Created template instance
     """
-    db_template = TaskTemplate(
-        user_id=user_id,
-        title=template_data.title,
-        description=template_data.description,
-        priority_id=template_data.priority_id,
-        is_recurring=template_data.is_recurring,
-        recurrence_pattern=template_data.recurrence_pattern,
-        tags=template_data.tags,
-        subtasks_template=template_data.subtasks,
-    )
-
-    db.add(db_template)
-    await db.commit()
-    await db.refresh(db_template)
-
-    # Re-fetch with eager loading
+    # INSERT ... RETURNING yields the row with DB-generated fields in the
+    # insert round-trip itself, replacing commit + refresh + re-fetch.
     stmt = (
-        select(TaskTemplate)
-        .where(TaskTemplate.id == db_template.id)
-        .options(selectinload(TaskTemplate.owner))
+        insert(TaskTemplate)
+        .values(
+            user_id=user_id,
+            title=template_data.title,
+            description=template_data.description,
+            priority_id=template_data.priority_id,
+            is_recurring=template_data.is_recurring,
+            recurrence_pattern=template_data.recurrence_pattern,
+            tags=template_data.tags,
+            subtasks_template=template_data.subtasks,
+        )
+        .returning(TaskTemplate)
     )
     result = await db.execute(stmt)
-    return result.scalar_one()
+    db_template = result.scalar_one()
+    await db.commit()
+    return db_template
 
 
 async def get_templates_by_user(
@@ -71,12 +73,8 @@ async def get_templates_by_user(
     Returns:
         List of user's templates
     """
-    # Start with base query with relationship loading
-    query = (
-        select(TaskTemplate)
-        .options(selectinload(TaskTemplate.owner))
-        .where(TaskTemplate.user_id == user_id)
-    )
+    # Base query; the owner relationship is never serialized, so no eager load
+    query = select(TaskTemplate).where(TaskTemplate.user_id == user_id)
 
     # Apply sorting
     if sort_by == "title":
@@ -99,7 +97,9 @@ async def get_templates_by_user(
     # Apply pagination
     query = query.limit(limit).offset(offset)
 
-    result = await db.execute(query)
+    # Stream rows through a server-side cursor instead of buffering the
+    # whole result set in the driver before hydration.
+    result = await db.execute(query, execution_options={"stream_results": True})
     return result.scalars().all()
 
 
@@ -119,12 +119,14 @@ async def get_template_by_id(
     Returns:
         Template instance if found and owned by user, None otherwise
     """
+    # LIMIT 1 + first() avoids the extra fetch scalar_one_or_none does to
+    # verify uniqueness (the PK filter already guarantees it).
     result = await db.execute(
         select(TaskTemplate)
-        .options(selectinload(TaskTemplate.owner))
         .where(TaskTemplate.id == template_id, TaskTemplate.user_id == user_id)
+        .limit(1)
     )
-    return result.scalar_one_or_none()
+    return result.scalars().first()
 
 
 async def update_template(
@@ -160,15 +162,7 @@ async def update_template(
 
     await db.commit()
     await db.refresh(template)
-
-    # Re-fetch with eager loading
-    stmt = (
-        select(TaskTemplate)
-        .where(TaskTemplate.id == template.id)
-        .options(selectinload(TaskTemplate.owner))
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one()
+    return template
 
 
 async def delete_template(db: AsyncSession, template: TaskTemplate) -> None:
@@ -190,10 +184,14 @@ async def create_task_from_template(
     title_override: Optional[str] = None,
     description_override: Optional[str] = None,
     due_date: Optional[str] = None
-) -> dict:
+) -> Task:
     """
     Create a task from a template with optional overrides.
 
+    Inserts the task directly in the current transaction instead of
+    returning a dict for the caller to validate and re-insert, so the
+    endpoint needs a single write round-trip.
+
     Args:
         db: Database session
         template: Template to create task from
@@ -203,23 +201,48 @@ async def create_task_from_template(
         due_date: Optional due date (YYYY-MM-DD format)
 
     Returns:
-        Dictionary containing task data ready for creation
+        Created task instance with priority relationship loaded
     """
-    from datetime import datetime
-
-    task_data = {
-        "title": title_override or template.title,
-        "description": description_override or template.description or "",
-        "priority_id": template.priority_id,
-        "is_recurring": template.is_recurring,
-        "recurrence_pattern": template.recurrence_pattern,
-    }
-
-    # Add due_date if provided
+    parsed_due = None
     if due_date:
         try:
-            task_data["due_date"] = datetime.strptime(due_date, '%Y-%m-%d').date()
+            parsed_due = date.fromisoformat(due_date)
         except ValueError:
             pass  # Invalid date format, skip
 
-    return task_data
+    db_task = Task(
+        user_id=user_id,
+        title=title_override or template.title,
+        description=description_override or template.description or "",
+        priority_id=template.priority_id,
+        completed=False,
+        is_recurring=template.is_recurring,
+        recurrence_pattern=template.recurrence_pattern,
+        due_date=parsed_due,
+    )
+
+    db.add(db_task)
+    await db.commit()
+    await db.refresh(db_task, attribute_names=["priority_obj"])
+
+    # Publish task-created event (fire and forget - same as task_crud.create_task)
+    try:
+        due = db_task.due_date
+        event_data = {
+            "task_id": db_task.id,
+            "user_id": user_id,
+            "title": db_task.title,
+            "description": db_task.description,
+            "priority_id": db_task.priority_id,
+            "due_date": due.isoformat() if due else None,
+            "completed": db_task.completed,
+            "is_recurring": db_task.is_recurring,
+            "recurrence_pattern": db_task.recurrence_pattern,
+            "created_at": db_task.created_at.isoformat()
+        }
+        await dapr_event_publisher.publish_task_created(event_data)
+        await event_logger.log_task_created(db, db_task.id, event_data)
+    except Exception as e:
+        logger.error(f"Failed to publish task-created event: {e}")
+
+    return db_task
@@ -1,12 +1,22 @@
 """User CRUD operations."""
 from typing import Optional
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, func, bindparam
+from sqlalchemy.orm import selectinload, raiseload
 
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.utils.security import hash_password
 
+# Hot auth lookups, built once at import time so each request only binds
+# parameters instead of constructing and compiling a new Select.
+# The email lookup is case-insensitive, backed by the users_email_lower
+# functional unique index; LIMIT 1 lets the planner stop at the first match.
+_SELECT_USER_BY_EMAIL = (
+    select(User).where(func.lower(User.email) == bindparam("email")).limit(1)
+)
+
 
 async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
     """
@@ -19,55 +29,74 @@ async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
     Returns:
         Created user instance
     """
-    hashed_password = hash_password(user_data.password)
-
-    db_user = User(
-        email=user_data.email,
-        name=user_data.name,
-        hashed_password=hashed_password,
+    hashed_password = await hash_password(user_data.password)
+
+    # INSERT ... RETURNING yields the row with DB-generated fields
+    # (id, created_at) in the insert round-trip, replacing commit + refresh.
+    stmt = (
+        insert(User)
+        .values(
+            email=user_data.email.lower(),
+            name=user_data.name,
+            hashed_password=hashed_password,
+        )
+        .returning(User)
     )
-
-    db.add(db_user)
+    result = await db.execute(stmt)
+    db_user = result.scalar_one()
     await db.commit()
-    await db.refresh(db_user)
 
     return db_user
 
 
-async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+async def get_user_by_email(
+    db: AsyncSession, email: str, include_tasks: bool = False
+) -> Optional[User]:
     """
     Get user by email address.
 
     Args:
         db: Database session
         email: User email
+        include_tasks: Eager-load the user's tasks in one extra SELECT
+            instead of N lazy loads downstream. Auth-only callers should
+            leave this off to keep the lookup lean.
 
     Returns:
         User instance if found, None otherwise
     """
-    result = await db.execute(select(User).where(User.email == email))
-    return result.scalar_one_or_none()
-
-
-async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[User]:
+    if include_tasks:
+        # raiseload("*") turns any other lazy relationship access into an
+        # error so N+1 regressions surface immediately instead of as
+        # silent extra queries
+        stmt = (
+            select(User)
+            .options(selectinload(User.tasks), raiseload("*"))
+            .where(func.lower(User.email) == email.lower())
+            .limit(1)
+        )
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    result = await db.execute(_SELECT_USER_BY_EMAIL, {"email": email.lower()})
+    return result.scalars().first()
+
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     """
     Get user by ID.
 
+    Callers are expected to hand over an already-parsed UUID (FastAPI /
+    the auth layer validates it once at the edge), so no re-validation
+    happens here.
+
     Args:
         db: Database session
-        user_id: User ID (UUID string)
+        user_id: User ID
 
     Returns:
         User instance if found, None otherwise
     """
-    # Import UUID for conversion
-    import uuid
-
-    try:
-        # Convert string to UUID
-        user_uuid = uuid.UUID(user_id)
-        result = await db.execute(select(User).where(User.id == user_uuid))
-        return result.scalar_one_or_none()
-    except (ValueError, TypeError):
-        # Invalid UUID format
-        return None
+    # session.get() short-circuits through the identity map: if this
+    # session already loaded the user (e.g. during auth), no query runs
+    return await db.get(User, user_id)
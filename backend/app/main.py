@@ -1,34 +1,56 @@
 """FastAPI application instance and configuration."""
+import asyncio
 import logging
 import os
-from fastapi import FastAPI, Request, HTTPException, Header
+import time
+from functools import partial
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import Response
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from starlette.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import create_tables
-from app.database import engine
-from alembic import command
-from alembic.config import Config
+from app.database import create_tables, warm_pool
+from app.utils.rate_limit import (
+    DEFAULT_BUCKET,
+    ROUTE_BUCKETS,
+    TESTING,
+    TOKEN_BUCKET_LUA,
+    LocalTokenBuckets,
+)
 # Import all models to ensure they're registered with Base.metadata
 from app.models import user, task, conversation, message, task_template, subtask
-from app.api.deps import get_db
 from sqlalchemy import text
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Alembic head this build expects; bump alongside new migrations.
+# Checked (not applied) during startup - migrate.py applies migrations.
+EXPECTED_ALEMBIC_HEAD = "017"
+
+# Environment is fixed for the process lifetime - resolve it once here
+# instead of hitting os.environ on every response in the middleware
+IS_PRODUCTION = os.getenv("ENVIRONMENT") == "production"
+
+# Static security headers applied to every response, built once
+_STATIC_SECURITY_HEADERS = (
+    ("X-Frame-Options", "DENY"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+)
+_HSTS_VALUE = "max-age=31536000; includeSubDomains; preload"
+
+# In-process fallback buckets for development without Redis
+_local_buckets = LocalTokenBuckets()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,23 +58,37 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application...")
 
-    # Run Alembic migrations to ensure database schema is up to date
-    # Skip migrations if SKIP_MIGRATIONS is set (useful for local dev)
+    # Migrations run once per deployment via `python migrate.py` (k8s
+    # Job / release step), not here: running `alembic upgrade head` in
+    # every worker's lifespan imports Alembic, scans the versions
+    # directory and serializes N workers behind one advisory lock at
+    # every cold start. The lifespan only checks the schema version -
+    # a single-row SELECT - and refuses to start production on mismatch.
+    # Skip the check if SKIP_MIGRATIONS is set (useful for local dev)
     if not os.getenv("SKIP_MIGRATIONS"):
         try:
-            alembic_cfg = Config("alembic.ini")
-            command.upgrade(alembic_cfg, "head")
-            logger.info("Database migrations complete")
+            from app.database import engine
+            async with engine.connect() as conn:
+                result = await conn.execute(
+                    text("SELECT version_num FROM alembic_version")
+                )
+                current_rev = result.scalar()
+            if current_rev != EXPECTED_ALEMBIC_HEAD:
+                error_msg = (
+                    f"Database schema at revision {current_rev}, expected "
+                    f"{EXPECTED_ALEMBIC_HEAD} - run `python migrate.py`"
+                )
+                if IS_PRODUCTION:
+                    # In production, fail loudly - don't start the app on a stale schema
+                    logger.error(f"CRITICAL: {error_msg}")
+                    raise RuntimeError(error_msg)
+                else:
+                    # In development, warn but continue
+                    logger.warning(f"{error_msg} - continuing in development mode")
+        except RuntimeError:
+            raise
         except Exception as e:
-            error_msg = f"Database migration failed: {e}"
-            if os.getenv("ENVIRONMENT") == "production":
-                # In production, fail loudly - don't start the app with broken migrations
-                logger.error(f"CRITICAL: {error_msg}")
-                logger.error("Application cannot start with failed migrations in production!")
-                raise RuntimeError(error_msg)
-            else:
-                # In development, warn but continue
-                logger.warning(f"{error_msg} - continuing in development mode")
+            logger.warning(f"Schema version check failed: {e} - continuing")
 
     # Try to create database tables but don't fail if it doesn't work
     try:
@@ -61,11 +97,56 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Database setup failed, but continuing: {e}")
 
+    # Warm the connection pool and prime hot statement plans so first
+    # requests don't pay connection + TLS + prepare latency
+    try:
+        await warm_pool()
+        logger.info("Connection pool warmed")
+    except Exception as e:
+        logger.warning(f"Pool warm-up failed, but continuing: {e}")
+
+    # Prime the debug router's messages-column cache once so dashboard
+    # polls of check-messages-columns are pure in-memory reads; the
+    # router itself is only mounted outside production
+    if not IS_PRODUCTION:
+        try:
+            from app.api.debug import prime_messages_columns
+            await prime_messages_columns()
+            logger.info("Messages-column cache primed")
+        except Exception as e:
+            logger.warning(f"Messages-column priming failed, but continuing: {e}")
+
+    # Shared Redis pool for rate limiting and any future caching; only
+    # opened when configured so local dev keeps working without Redis
+    if settings.REDIS_URL:
+        try:
+            import redis.asyncio as aioredis
+            app.state.redis = aioredis.Redis.from_url(
+                settings.REDIS_URL, decode_responses=False
+            )
+            # Cache the token-bucket script server-side so each request
+            # is a single EVALSHA round-trip
+            app.state.rate_limit_sha = await app.state.redis.script_load(
+                TOKEN_BUCKET_LUA
+            )
+            logger.info("Redis connection pool ready")
+        except Exception as e:
+            app.state.redis = None
+            logger.warning(f"Redis setup failed, but continuing: {e}")
+    else:
+        app.state.redis = None
+
     logger.info("Application startup complete")
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    if getattr(app.state, "redis", None) is not None:
+        await app.state.redis.aclose()
+    # Close out pooled connections so reloads don't leak sockets and
+    # leave idle-in-transaction sessions behind on Postgres
+    from app.database import engine
+    await engine.dispose()
 
 # Create FastAPI application
 app = FastAPI(
@@ -75,41 +156,81 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # orjson (C extension) serializes response bodies several times
+    # faster than the stdlib json encoder FastAPI defaults to
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"],  # Allow all headers
-)
+# Middleware stack. Starlette wraps middlewares in reverse add order
+# (last added = outermost), so registration below builds, from the
+# outside in: HTTPS redirect (production) -> TrustedHost -> CORS ->
+# security headers -> rate limiting -> routes. That way TLS failures
+# and bad Host headers are rejected before any app work, and CORS
+# answers OPTIONS preflights before they reach the limiter.
+
+# Token-bucket rate limiting. With Redis the buckets are shared across
+# workers and updated by one atomic EVALSHA (no sync-client threadpool
+# hop like the old SlowAPI wrapper); without Redis the per-process
+# fallback applies the same math. Fails open if Redis errors.
+@app.middleware("http")
+async def rate_limit_middleware(request: Request, call_next):
+    if TESTING:
+        return await call_next(request)
+
+    path = request.url.path
+    capacity, refill_rate = ROUTE_BUCKETS.get(path, DEFAULT_BUCKET)
+    client_ip = request.client.host if request.client else "anonymous"
+    key = f"rl:{client_ip}:{path}"
+
+    redis_conn = getattr(app.state, "redis", None)
+    allowed = True
+    if redis_conn is not None:
+        try:
+            allowed = bool(await redis_conn.evalsha(
+                app.state.rate_limit_sha, 1, key,
+                capacity, refill_rate, int(time.time() * 1000),
+            ))
+        except Exception as e:
+            logger.warning(f"Rate limit check failed, allowing request: {e}")
+    else:
+        allowed = _local_buckets.allow(key, capacity, refill_rate)
 
-# Configure rate limiting exception handler
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    if not allowed:
+        return JSONResponse(
+            status_code=429,
+            content={"error": f"Rate limit exceeded: {capacity} requests per window"},
+        )
+    return await call_next(request)
 
 # Add security headers middleware
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
+    # Preflights are answered by the CORS layer above; don't spend
+    # header writes on them
+    if request.method == "OPTIONS":
+        return await call_next(request)
+
     response = await call_next(request)
 
     # Add security headers
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    for name, value in _STATIC_SECURITY_HEADERS:
+        response.headers[name] = value
 
     # Add HSTS header only in production and over HTTPS
-    if os.getenv("ENVIRONMENT") == "production":
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
+    if IS_PRODUCTION:
+        response.headers["Strict-Transport-Security"] = _HSTS_VALUE
 
     return response
 
-# Add HTTPS redirect middleware (only in production)
-if os.getenv("ENVIRONMENT") == "production":
-    app.add_middleware(HTTPSRedirectMiddleware)
+# Configure CORS middleware (outside the security/rate-limit layers so
+# preflight OPTIONS short-circuit here)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins_list,
+    allow_credentials=True,
+    allow_methods=["*"],  # Allow all HTTP methods
+    allow_headers=["*"],  # Allow all headers
+)
 
 # Add trusted host middleware
 app.add_middleware(
@@ -117,929 +238,79 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS if hasattr(settings, 'ALLOWED_HOSTS') else ["*"]
 )
 
+# Add HTTPS redirect middleware (only in production) - outermost, so
+# TLS-failing requests never traverse the rest of the stack
+if IS_PRODUCTION:
+    app.add_middleware(HTTPSRedirectMiddleware)
+
 # Global exception handlers
+# 500 body never varies - serialize it once so error storms don't pay
+# per-response dict building and JSON encoding
+_ERR_500_BODY = orjson.dumps({
+    "error": "Internal Server Error",
+    "message": "An unexpected error occurred. Please try again later.",
+})
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors with clear messages."""
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error["loc"])
-        message = error["msg"]
-        errors.append(f"{field}: {message}")
+    errors = [
+        " -> ".join(str(loc) for loc in error["loc"]) + f": {error['msg']}"
+        for error in exc.errors()
+    ]
 
-    return JSONResponse(
-        status_code=422,
-        content={
+    return Response(
+        content=orjson.dumps({
             "error": "Validation Error",
             "message": "Please check your input",
-            "details": errors
-        }
+            "details": errors,
+        }),
+        status_code=422,
+        media_type="application/json",
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected server errors."""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
+    # Traceback formatting is synchronous and can be slow under error
+    # storms - push it to the default executor so the event loop keeps
+    # serving other requests
+    asyncio.get_running_loop().run_in_executor(
+        None, partial(logger.error, f"Unexpected error: {exc}", exc_info=exc)
+    )
 
-    return JSONResponse(
+    return Response(
+        content=_ERR_500_BODY,
         status_code=500,
-        content={
-            "error": "Internal Server Error",
-            "message": "An unexpected error occurred. Please try again later."
-        }
+        media_type="application/json",
     )
 
 
+# Bodies for the two static endpoints, serialized once at import time.
+# /health is polled by load balancers on every instance, so the hot
+# path is reduced to returning pre-encoded bytes with no per-request
+# JSON encoding at all.
+_ROOT_BODY = orjson.dumps({
+    "message": "Todo AI Assistant API",
+    "version": "5.0.0",
+    "phase": "V - Event-Driven Architecture",
+    "status": "online",
+    "docs": "/docs",
+})
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint - API health check."""
-    return {
-        "message": "Todo AI Assistant API",
-        "version": "5.0.0",
-        "phase": "V - Event-Driven Architecture",
-        "status": "online",
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for monitoring."""
-    return {"status": "healthy"}
-
-@app.get("/debug/ai-config", tags=["Debug"])
-async def debug_ai_config():
-    """Debug endpoint to check AI configuration."""
-    import os
-    return {
-        "groq_key_set": bool(os.getenv("GROQ_API_KEY")),
-        "gemini_key_set": bool(os.getenv("GEMINI_API_KEY")),
-        "openai_key_set": bool(os.getenv("OPENAI_API_KEY")),
-        "configured_model": settings.AI_MODEL,
-        "configured_base_url": settings.AI_BASE_URL,
-        "ai_api_key_first_chars": settings.AI_API_KEY[:10] if settings.AI_API_KEY else "NOT SET"
-    }
-
-@app.get("/test-db", tags=["Test"])
-async def test_database():
-    """Test database connection."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            return {"status": "database connected", "result": result.scalar()}
-    except Exception as e:
-        return {"status": "database error", "error": str(e)}
-
-@app.get("/test-tables", tags=["Test"])
-async def test_tables():
-    """Test if database tables exist."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            # Check if users table exists
-            result = await conn.execute(
-                text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'users')")
-            )
-            users_exist = result.scalar()
-
-            # Check if tasks table exists
-            result = await conn.execute(
-                text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'tasks')")
-            )
-            tasks_exist = result.scalar()
-
-            return {
-                "status": "tables checked",
-                "users_table": users_exist,
-                "tasks_table": tasks_exist
-            }
-    except Exception as e:
-        return {"status": "error checking tables", "error": str(e)}
-
-@app.post("/test-register", tags=["Test"])
-async def test_register():
-    """Test user registration directly."""
-    try:
-        from app.database import get_db
-        from app.crud import user as user_crud
-        from app.schemas.user import UserCreate
-        from app.models.user import User
-        from sqlalchemy.ext.asyncio import AsyncSession
-        from sqlalchemy import text
-
-        # Check what columns exist in users table
-        async for db in get_db():
-            result = await db.execute(
-                text("""
-                    SELECT column_name, data_type
-                    FROM information_schema.columns
-                    WHERE table_name = 'users'
-                    ORDER BY ordinal_position
-                """)
-            )
-            columns = result.fetchall()
-
-            # Check if hashed_password column exists
-            has_hashed_password = any(col[0] == 'hashed_password' for col in columns)
-            has_preferences = any(col[0] == 'preferences' for col in columns)
-
-            # Add missing columns
-            columns_added = []
-
-            if not has_hashed_password:
-                try:
-                    await db.execute(
-                        text("ALTER TABLE users ADD COLUMN hashed_password VARCHAR(255)")
-                    )
-                    columns_added.append("hashed_password")
-                except Exception as alter_error:
-                    return {
-                        "status": "error",
-                        "message": f"Failed to add hashed_password column: {alter_error}",
-                        "existing_columns": [col[0] for col in columns],
-                        "schema_issue": True
-                    }
-
-            if not has_preferences:
-                try:
-                    await db.execute(
-                        text("ALTER TABLE users ADD COLUMN preferences JSONB")
-                    )
-                    columns_added.append("preferences")
-                except Exception as alter_error:
-                    return {
-                        "status": "error",
-                        "message": f"Failed to add preferences column: {alter_error}",
-                        "existing_columns": [col[0] for col in columns],
-                        "schema_issue": True
-                    }
-
-            # Check if id column is auto-incrementing
-            has_id = any(col[0] == 'id' for col in columns)
-            if has_id:
-                # Create a sequence if it doesn't exist
-                try:
-                    await db.execute(text("""
-                        CREATE SEQUENCE IF NOT EXISTS users_id_seq
-                        OWNED BY users.id
-                    """))
-                    await db.execute(text("""
-                        ALTER TABLE users
-                        ALTER COLUMN id
-                        SET DEFAULT nextval('users_id_seq')
-                    """))
-                    columns_added.append("id sequence")
-                except Exception as seq_error:
-                    # Sequence might already exist or table might be empty
-                    pass
-
-            if columns_added:
-                await db.commit()
-                return {
-                    "status": "success",
-                    "message": f"Added columns to users table: {', '.join(columns_added)}",
-                    "columns_before": [col[0] for col in columns],
-                    "columns_added": columns_added,
-                    "action": "Schema updated successfully"
-                }
-
-            # Create test user data
-            user_data = UserCreate(
-                email="test789@example.com",  # Use new email
-                password="testpass123"  # 8 characters minimum
-            )
-
-            # Check if user already exists
-            existing_user = await user_crud.get_user_by_email(db, user_data.email)
-            if existing_user:
-                return {
-                    "status": "error",
-                    "message": "User already exists",
-                    "user_id": existing_user.id,
-                    "columns": [col[0] for col in columns],
-                    "has_hashed_password": has_hashed_password,
-                    "has_preferences": has_preferences
-                }
-
-            # Create user
-            user = await user_crud.create_user(db, user_data)
-
-            return {
-                "status": "success",
-                "user_id": user.id,
-                "email": user.email,
-                "columns": [col[0] for col in columns],
-                "has_hashed_password": has_hashed_password,
-                "has_preferences": has_preferences,
-                "password_hashed": bool(user.hashed_password) if hasattr(user, 'hashed_password') else "N/A"
-            }
-            break  # Exit after first iteration
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/test-direct-user", tags=["Test"])
-async def test_direct_user():
-    """Test creating a user directly with SQL."""
-    try:
-        from app.database import engine
-        from app.utils.security import hash_password
-        from sqlalchemy import text
-        import uuid
-
-        # Hash password
-        hashed = hash_password("testpass123")
-
-        # Generate a UUID
-        user_id = str(uuid.uuid4())
-
-        # Insert user directly with SQL
-        async with engine.begin() as conn:
-            # Insert user with explicit UUID and all required fields
-            result = await conn.execute(text("""
-                INSERT INTO users (id, email, password_hash, name, hashed_password, created_at)
-                VALUES (:id, :email, :password, :name, :password, NOW())
-                RETURNING id
-            """), {"id": user_id, "email": "test456@example.com", "password": hashed, "name": "Test User"})
-
-            inserted_id = result.scalar()
-
-            await conn.commit()
-
-            return {
-                "status": "success",
-                "message": "User created successfully",
-                "user_id": inserted_id,
-                "email": "test456@example.com"
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/test-schema", tags=["Test"])
-async def test_schema():
-    """Check database schema."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = 'users'
-                ORDER BY ordinal_position
-            """))
-            columns = result.fetchall()
-
-            return {
-                "status": "success",
-                "table": "users",
-                "columns": [{"name": col[0], "type": col[1], "nullable": col[2]} for col in columns]
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/test-tasks-schema", tags=["Test"])
-async def test_tasks_schema():
-    """Check tasks table schema."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable, column_default
-                FROM information_schema.columns
-                WHERE table_name = 'tasks'
-                ORDER BY ordinal_position
-            """))
-            columns = result.fetchall()
-
-            return {
-                "status": "success",
-                "table": "tasks",
-                "columns": [
-                    {"name": col[0], "type": col[1], "nullable": col[2], "default": col[3]}
-                    for col in columns
-                ]
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/test-priority-table", tags=["Test"])
-async def test_priority_table():
-    """Check if priority table exists."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            # Check if priority table exists
-            result = await conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_name = 'priorities'
-                );
-            """))
-            table_exists = result.scalar()
-
-            result2 = await conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_name = 'task_priorities'
-                );
-            """))
-            table2_exists = result2.scalar()
-
-            return {
-                "status": "success",
-                "priorities_table": table_exists,
-                "task_priorities_table": table2_exists
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/test-priorities-data", tags=["Test"])
-async def test_priorities_data():
-    """Check what's in the priorities table."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            result = await conn.execute(text("""
-                SELECT * FROM priorities ORDER BY id;
-            """))
-            rows = result.fetchall()
-
-            return {
-                "status": "success",
-                "priorities": [dict(row._mapping) for row in rows]
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/test-create-priorities", tags=["Test"])
-async def test_create_priorities():
-    """Create default priorities if they don't exist."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            # First, check the table schema
-            result = await conn.execute(text("""
-                SELECT column_name, data_type
-                FROM information_schema.columns
-                WHERE table_name = 'priorities'
-                ORDER BY ordinal_position
-            """))
-            columns = result.fetchall()
-
-            # Check if priorities exist
-            result = await conn.execute(text("SELECT COUNT(*) FROM priorities"))
-            count = result.scalar()
-
-            if count == 0:
-                # Insert default priorities with level and color
-                await conn.execute(text("""
-                    INSERT INTO priorities (id, name, level, color) VALUES
-                    (1, 'Low', 1, '#28a745'),
-                    (2, 'Medium', 2, '#ffc107'),
-                    (3, 'High', 3, '#dc3545')
-                """))
-                await conn.commit()
-                return {
-                    "status": "success",
-                    "message": "Default priorities created",
-                    "columns": [{"name": col[0], "type": col[1]} for col in columns]
-                }
-            else:
-                return {
-                    "status": "success",
-                    "message": f"Priorities already exist ({count} rows)",
-                    "columns": [{"name": col[0], "type": col[1]} for col in columns]
-                }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/test-create-task", tags=["Test"])
-async def test_create_task_direct():
-    """Test creating a task directly with SQL."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            # Get an existing user
-            result = await conn.execute(text("""
-                SELECT id FROM users LIMIT 1
-            """))
-            user_row = result.scalar_one_or_none()
-
-            if not user_row:
-                return {"status": "error", "message": "No users found"}
-
-            user_uuid = str(user_row)
-
-            # Insert task
-            result2 = await conn.execute(text("""
-                INSERT INTO tasks (user_id, title, description, priority_id, completed, created_at, updated_at)
-                VALUES (:user_id, :title, :description, :priority_id, false, NOW(), NOW())
-                RETURNING id
-            """), {"user_id": user_uuid, "title": "Test Task", "description": "Test Description", "priority_id": 2})
-
-            task_id = result2.scalar()
-
-            await conn.commit()
-
-            return {
-                "status": "success",
-                "message": "Task created successfully",
-                "user_id": user_uuid,
-                "task_id": task_id
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/test-create-task-crud", tags=["Test"])
-async def test_create_task_crud():
-    """Test creating a task via CRUD operations."""
-    try:
-        from app.database import get_db
-        from app.crud import task as task_crud
-        from app.schemas.task import TaskCreate
-
-        async for db in get_db():
-            # Get an existing user
-            from sqlalchemy import text
-            result = await db.execute(text("""
-                SELECT id FROM users LIMIT 1
-            """))
-            user_row = result.scalar_one_or_none()
-
-            if not user_row:
-                return {"status": "error", "message": "No users found"}
-
-            user_uuid = str(user_row)
-
-            # Create task data
-            task_data = TaskCreate(
-                title="Test CRUD Task",
-                description="Testing CRUD task creation",
-                priority_id=2
-            )
-
-            # Create task via CRUD
-            task = await task_crud.create_task(db, task_data, user_uuid)
-
-            return {
-                "status": "success",
-                "message": "Task created successfully via CRUD",
-                "task_id": task.id,
-                "priority_obj": task.priority_obj.name if task.priority_obj else None
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/test-auth", tags=["Test"])
-async def test_auth(authorization: str = Header(None)):
-    """Test authentication flow"""
-    return {
-        "authorization": authorization,
-        "has_auth": authorization is not None,
-        "auth_length": len(authorization) if authorization else 0
-    }
-
-
-@app.post("/force-migration", tags=["Emergency"])
-async def force_migration():
-    """EMERGENCY: Force run the UUID migration for conversations and messages tables."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-        import logging
-
-        # Set up detailed logging
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-
-        async with engine.begin() as conn:
-            # Check current migration state
-            result = await conn.execute(text("""
-                SELECT version_num FROM alembic_version
-            """))
-            current_version = result.scalar()
-
-            logger.info(f"Current Alembic version: {current_version}")
-
-            # Check if conversations table exists and what type its id column is
-            result = await conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_name = 'conversations'
-                )
-            """))
-            conversations_exist = result.scalar()
-
-            if conversations_exist:
-                result = await conn.execute(text("""
-                    SELECT data_type
-                    FROM information_schema.columns
-                    WHERE table_name = 'conversations' AND column_name = 'id'
-                """))
-                id_type = result.scalar()
-                logger.info(f"Conversations table exists with id type: {id_type}")
-
-                # If it's still integer, we need to run the migration
-                if id_type == 'integer':
-                    logger.info("Running UUID migration for conversations and messages...")
-
-                    # Drop the tables and recreate with UUID columns
-                    await conn.execute(text('DROP TABLE IF EXISTS messages CASCADE'))
-                    await conn.execute(text('DROP TABLE IF EXISTS conversations CASCADE'))
-
-                    # Recreate conversations table with UUID columns
-                    await conn.execute(text("""
-                        CREATE TABLE conversations (
-                            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                            title VARCHAR(200) NOT NULL DEFAULT 'New Conversation',
-                            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                            updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-                        )
-                    """))
-
-                    # Create index for performance
-                    await conn.execute(text("""
-                        CREATE INDEX idx_conversations_created_at_desc
-                        ON conversations (created_at DESC)
-                    """))
-
-                    # Recreate messages table with UUID columns
-                    await conn.execute(text("""
-                        CREATE TABLE messages (
-                            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                            conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
-                            role VARCHAR(20) NOT NULL CHECK (role IN ('user', 'assistant', 'system', 'tool')),
-                            content TEXT NOT NULL,
-                            tool_calls JSONB,
-                            tool_call_id VARCHAR(100),
-                            name VARCHAR(100),
-                            created_at TIMESTAMP NOT NULL DEFAULT NOW()
-                        )
-                    """))
-
-                    # Create index for performance
-                    await conn.execute(text("""
-                        CREATE INDEX idx_messages_conversation_created
-                        ON messages (conversation_id, created_at)
-                    """))
-
-                    # Update alembic version to mark this migration as applied
-                    await conn.execute(text("""
-                        UPDATE alembic_version SET version_num = 'e940f362bb65'
-                    """))
-
-                    await conn.commit()
-
-                    logger.info("UUID migration completed successfully!")
-
-                    return {
-                        "status": "success",
-                        "message": "UUID migration applied successfully",
-                        "previous_version": current_version,
-                        "new_version": "e940f362bb65",
-                        "action": "Tables recreated with UUID columns"
-                    }
-                else:
-                    logger.info("Conversations table already has UUID columns")
-                    return {
-                        "status": "success",
-                        "message": "UUID columns already exist",
-                        "current_version": current_version,
-                        "id_type": id_type
-                    }
-            else:
-                # Tables don't exist, mark migration as applied
-                await conn.execute(text("""
-                    UPDATE alembic_version SET version_num = 'e940f362bb65'
-                """))
-                await conn.commit()
-
-                return {
-                    "status": "success",
-                    "message": "Tables don't exist, migration marked as applied",
-                    "current_version": current_version
-                }
-
-    except Exception as e:
-        import traceback
-        logger.error(f"Migration failed: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/check-conversation-schema", tags=["Test"])
-async def check_conversation_schema():
-    """Check if conversations and messages tables have correct UUID schema."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            # Check conversations table
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable, column_default
-                FROM information_schema.columns
-                WHERE table_name = 'conversations'
-                ORDER BY ordinal_position
-            """))
-            conv_columns = result.fetchall()
-
-            # Check messages table
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable, column_default
-                FROM information_schema.columns
-                WHERE table_name = 'messages'
-                ORDER BY ordinal_position
-            """))
-            msg_columns = result.fetchall()
-
-            # Check alembic version
-            result = await conn.execute(text("""
-                SELECT version_num FROM alembic_version
-            """))
-            alembic_version = result.scalar()
-
-            return {
-                "status": "success",
-                "alembic_version": alembic_version,
-                "conversations_table": [
-                    {
-                        "name": col[0],
-                        "type": col[1],
-                        "nullable": col[2],
-                        "default": col[3]
-                    }
-                    for col in conv_columns
-                ],
-                "messages_table": [
-                    {
-                        "name": col[0],
-                        "type": col[1],
-                        "nullable": col[2],
-                        "default": col[3]
-                    }
-                    for col in msg_columns
-                ]
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.get("/check-messages-columns", tags=["Migration"])
-async def check_messages_columns():
-    """Check what columns exist in the messages table."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        async with engine.begin() as conn:
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, character_maximum_length
-                FROM information_schema.columns
-                WHERE table_name = 'messages'
-                ORDER BY ordinal_position
-            """))
-            columns = [
-                {
-                    "name": row[0],
-                    "type": row[1],
-                    "max_length": row[2]
-                }
-                for row in result.fetchall()
-            ]
-
-            has_tool_call_id = any(col["name"] == "tool_call_id" for col in columns)
-            has_name = any(col["name"] == "name" for col in columns)
-
-            return {
-                "status": "success",
-                "columns": columns,
-                "has_tool_call_id": has_tool_call_id,
-                "has_name": has_name,
-                "ready_for_chat": has_tool_call_id and has_name
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/add-tool-columns", tags=["Migration"])
-async def add_tool_columns():
-    """Add missing tool_call_id and name columns to messages table."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-        import logging
-
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-
-        async with engine.begin() as conn:
-            # Check if columns exist
-            result = await conn.execute(text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'messages'
-                AND column_name IN ('tool_call_id', 'name')
-            """))
-            existing_columns = [row[0] for row in result.fetchall()]
-
-            columns_added = []
-
-            # Add tool_call_id if it doesn't exist
-            if 'tool_call_id' not in existing_columns:
-                await conn.execute(text("""
-                    ALTER TABLE messages
-                    ADD COLUMN tool_call_id VARCHAR(100)
-                """))
-                columns_added.append('tool_call_id')
-                logger.info("Added column 'tool_call_id' to messages table")
-            else:
-                logger.info("Column 'tool_call_id' already exists")
-
-            # Add name if it doesn't exist
-            if 'name' not in existing_columns:
-                await conn.execute(text("""
-                    ALTER TABLE messages
-                    ADD COLUMN name VARCHAR(100)
-                """))
-                columns_added.append('name')
-                logger.info("Added column 'name' to messages table")
-            else:
-                logger.info("Column 'name' already exists")
-
-            await conn.commit()
-
-            if columns_added:
-                return {
-                    "status": "success",
-                    "message": f"Added columns: {', '.join(columns_added)}",
-                    "columns_added": columns_added
-                }
-            else:
-                return {
-                    "status": "success",
-                    "message": "All columns already exist",
-                    "columns_added": []
-                }
-
-    except Exception as e:
-        import traceback
-        logger.error(f"Failed to add columns: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
-
-@app.post("/test-conversation-creation", tags=["Test"])
-async def test_conversation_creation():
-    """Test creating a conversation to verify UUID schema works."""
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-        import uuid
-
-        async with engine.begin() as conn:
-            # Get a user ID
-            result = await conn.execute(text("""
-                SELECT id FROM users LIMIT 1
-            """))
-            user_row = result.scalar_one_or_none()
-
-            if not user_row:
-                return {"status": "error", "message": "No users found"}
-
-            user_id = str(user_row)
-            conversation_id = str(uuid.uuid4())
-
-            # Try to insert a conversation with UUID
-            result = await conn.execute(text("""
-                INSERT INTO conversations (id, user_id, title, created_at, updated_at)
-                VALUES (:id, :user_id, :title, NOW(), NOW())
-                RETURNING id
-            """), {
-                "id": conversation_id,
-                "user_id": user_id,
-                "title": "Test Conversation"
-            })
-
-            inserted_id = result.scalar()
-
-            await conn.commit()
-
-            return {
-                "status": "success",
-                "message": "Conversation created successfully with UUID",
-                "conversation_id": inserted_id,
-                "user_id": user_id
-            }
-
-    except Exception as e:
-        import traceback
-        return {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Import routers
 from app.api import auth, tasks, users, chat, analytics, task_templates, subtasks
@@ -1048,6 +319,12 @@ from app.api import background_jobs
 from app.api import email
 
 # Include routers
+# Diagnostic/DDL endpoints live in app.api.debug; the import itself is
+# kept out of production so neither the routes nor their dependencies
+# are loaded there
+if not IS_PRODUCTION:
+    from app.api import debug
+    app.include_router(debug.debug_router)
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
 app.include_router(subtasks.router, prefix="/api", tags=["Subtasks"])
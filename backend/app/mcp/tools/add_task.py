@@ -1,13 +1,55 @@
 """MCP tool: add_task - Create tasks via natural language."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import HTTPException
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
 from app.crud.task import create_task
 from app.schemas.task import TaskCreate
 
 
-async def add_task(user_id: int, title: str, description: str = "") -> Dict[str, Any]:
+class AddTaskArgs(BaseModel):
+    """Validated add_task arguments.
+
+    One pydantic-core (Rust) validation pass replaces the four Python
+    branch checks this tool previously ran per call.
+    """
+
+    user_id: int = Field(gt=0)
+    title: str = Field(min_length=1, max_length=500)
+    description: str = Field(default="", max_length=10000)
+
+    @field_validator("title")
+    @classmethod
+    def _strip_title(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("Title is required and must not be empty")
+        return v
+
+    @field_validator("description")
+    @classmethod
+    def _strip_description(cls, v: str) -> str:
+        return v.strip()
+
+
+def _args_error(exc: ValidationError) -> HTTPException:
+    """Map a ValidationError to the tool's HTTP error contract."""
+    first = exc.errors()[0]
+    if first["loc"] and first["loc"][0] == "user_id":
+        return HTTPException(status_code=401, detail="User ID validation failed")
+    field = first["loc"][0] if first["loc"] else "arguments"
+    return HTTPException(status_code=400, detail=f"{field}: {first['msg']}")
+
+
+async def add_task(
+    user_id: int,
+    title: str,
+    description: str = "",
+    *,
+    session: Optional[AsyncSession] = None,
+) -> Dict[str, Any]:
     """
     Create a new task for the authenticated user.
 
@@ -18,6 +60,10 @@ async def add_task(user_id: int, title: str, description: str = "") -> Dict[str,
         user_id: ID of the user creating the task (auto-injected by agent)
         title: Task title extracted from user's natural language input (1-500 chars)
         description: Optional detailed description (max 10000 chars)
+        session: Existing database session to reuse; when the agent runs
+            several tools in one turn, sharing one session avoids a pool
+            checkout and session setup per call. A fresh session is
+            opened if omitted.
 
     Returns:
         Dict with task_id, status="created", and title
@@ -32,25 +78,16 @@ async def add_task(user_id: int, title: str, description: str = "") -> Dict[str,
         >>> await add_task(user_id=1, title="Finish Q4 report", description="Complete financial analysis")
         {"task_id": 43, "status": "created", "title": "Finish Q4 report"}
     """
-    # Validation: user_id required
-    if not user_id or user_id <= 0:
-        raise HTTPException(status_code=401, detail="User ID validation failed")
-
-    # Validation: title required and length constraints
-    if not title or not title.strip():
-        raise HTTPException(status_code=400, detail="Title is required and must not be empty")
-
-    if len(title) > 500:
-        raise HTTPException(status_code=400, detail="Title must not exceed 500 characters")
-
-    # Validation: description length constraint
-    if description and len(description) > 10000:
-        raise HTTPException(status_code=400, detail="Description must not exceed 10000 characters")
+    # All argument checks in one pydantic-core pass
+    try:
+        args = AddTaskArgs(user_id=user_id, title=title, description=description or "")
+    except ValidationError as exc:
+        raise _args_error(exc)
 
     # Create task using existing CRUD
-    async with AsyncSessionLocal() as db:
+    async def _run(db: AsyncSession) -> Dict[str, Any]:
         try:
-            task_data = TaskCreate(title=title.strip(), description=description.strip() if description else "")
+            task_data = TaskCreate(title=args.title, description=args.description)
             task = await create_task(db, task_data, user_id)
 
             return {
@@ -61,3 +98,8 @@ async def add_task(user_id: int, title: str, description: str = "") -> Dict[str,
         except Exception as e:
             # Log error and re-raise
             raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
+
+    if session is not None:
+        return await _run(session)
+    async with AsyncSessionLocal() as db:
+        return await _run(db)
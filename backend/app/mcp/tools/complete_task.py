@@ -1,12 +1,18 @@
 """MCP tool: complete_task - Toggle task completion via natural language."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
-from app.crud.task import get_task_by_id, toggle_task_completion
+from app.crud.task import toggle_task_atomic
 
 
-async def complete_task(user_id: int, task_id: int) -> Dict[str, Any]:
+async def complete_task(
+    user_id: int,
+    task_id: int,
+    *,
+    session: Optional[AsyncSession] = None,
+) -> Dict[str, Any]:
     """
     Toggle task completion status (complete ⟷ incomplete).
 
@@ -16,6 +22,8 @@ async def complete_task(user_id: int, task_id: int) -> Dict[str, Any]:
     Args:
         user_id: ID of the user (auto-injected by agent)
         task_id: ID of the task to toggle
+        session: Existing database session to reuse across tool calls in
+            one agent turn; a fresh session is opened if omitted
 
     Returns:
         Dict with task_id, status ("completed" or "incomplete"), and title
@@ -35,31 +43,33 @@ async def complete_task(user_id: int, task_id: int) -> Dict[str, Any]:
     if not task_id or task_id <= 0:
         raise HTTPException(status_code=400, detail="Task ID is required")
 
-    # Get and toggle task
-    async with AsyncSessionLocal() as db:
+    # Toggle in one UPDATE ... RETURNING round-trip; the WHERE clause
+    # enforces ownership so no prior SELECT is needed
+    async def _run(db: AsyncSession) -> Dict[str, Any]:
+        # Only the DB call needs the 500 guard; the 404 and the response
+        # build below can't raise, so keeping them outside drops the
+        # except HTTPException: raise re-dispatch from the happy path
         try:
-            # Get task with ownership validation
-            task = await get_task_by_id(db, task_id, user_id)
-
-            if not task:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Task {task_id} not found or does not belong to user"
-                )
-
-            # Toggle completion status
-            updated_task = await toggle_task_completion(db, task)
-
-            return {
-                "task_id": updated_task.id,
-                "status": "completed" if updated_task.completed else "incomplete",
-                "title": updated_task.title,
-            }
-
-        except HTTPException:
-            raise
+            row = await toggle_task_atomic(db, task_id, user_id)
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to toggle task completion: {str(e)}"
             )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task {task_id} not found or does not belong to user"
+            )
+
+        return {
+            "task_id": row.id,
+            "status": "completed" if row.completed else "incomplete",
+            "title": row.title,
+        }
+
+    if session is not None:
+        return await _run(session)
+    async with AsyncSessionLocal() as db:
+        return await _run(db)
@@ -1,12 +1,18 @@
 """MCP tool: delete_task - Remove tasks via natural language with confirmation."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
-from app.crud.task import get_task_by_id, delete_task as delete_task_crud
+from app.crud.task import delete_task_atomic
 
 
-async def delete_task(user_id: int, task_id: int) -> Dict[str, Any]:
+async def delete_task(
+    user_id: int,
+    task_id: int,
+    *,
+    session: Optional[AsyncSession] = None,
+) -> Dict[str, Any]:
     """
     Delete a task permanently.
 
@@ -18,6 +24,8 @@ async def delete_task(user_id: int, task_id: int) -> Dict[str, Any]:
     Args:
         user_id: ID of the user (auto-injected by agent)
         task_id: ID of the task to delete
+        session: Existing database session to reuse across tool calls in
+            one agent turn; a fresh session is opened if omitted
 
     Returns:
         Dict with task_id, status="deleted", and title of deleted task
@@ -37,34 +45,33 @@ async def delete_task(user_id: int, task_id: int) -> Dict[str, Any]:
     if not task_id or task_id <= 0:
         raise HTTPException(status_code=400, detail="Task ID is required")
 
-    # Delete task
-    async with AsyncSessionLocal() as db:
+    # Delete in one DELETE ... RETURNING round-trip; the WHERE clause
+    # enforces ownership so no prior SELECT is needed
+    async def _run(db: AsyncSession) -> Dict[str, Any]:
+        # Only the DB call needs the 500 guard; the 404 and the response
+        # build below can't raise, so keeping them outside drops the
+        # except HTTPException: raise re-dispatch from the happy path
         try:
-            # Get task with ownership validation
-            task = await get_task_by_id(db, task_id, user_id)
-
-            if not task:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Task {task_id} not found or does not belong to user"
-                )
-
-            # Store title before deletion
-            task_title = task.title
-
-            # Delete task
-            await delete_task_crud(db, task)
-
-            return {
-                "task_id": task_id,
-                "status": "deleted",
-                "title": task_title,
-            }
-
-        except HTTPException:
-            raise
+            row = await delete_task_atomic(db, task_id, user_id)
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to delete task: {str(e)}"
             )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task {task_id} not found or does not belong to user"
+            )
+
+        return {
+            "task_id": row.id,
+            "status": "deleted",
+            "title": row.title,
+        }
+
+    if session is not None:
+        return await _run(session)
+    async with AsyncSessionLocal() as db:
+        return await _run(db)
@@ -1,14 +1,21 @@
 """MCP tool: list_tasks - Retrieve tasks via natural language."""
-from typing import Dict, Any, List, Literal
+from typing import Dict, Any, List, Literal, Optional
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
-from app.crud.task import get_tasks_by_user
+from app.crud.task import list_task_rows
+
+# Built once: set membership beats rebuilding a list literal and
+# linear-scanning it on every tool invocation
+_ALLOWED_STATUSES = frozenset({"all", "pending", "completed"})
 
 
 async def list_tasks(
     user_id: int,
-    status: Literal["all", "pending", "completed"] = "all"
+    status: Literal["all", "pending", "completed"] = "all",
+    *,
+    session: Optional[AsyncSession] = None,
 ) -> Dict[str, Any]:
     """
     Retrieve tasks for the authenticated user with optional status filtering.
@@ -19,6 +26,8 @@ async def list_tasks(
     Args:
         user_id: ID of the user retrieving tasks (auto-injected by agent)
         status: Filter by status - "all", "pending", or "completed" (default: "all")
+        session: Existing database session to reuse across tool calls in
+            one agent turn; a fresh session is opened if omitted
 
     Returns:
         Dict with tasks array and count
@@ -38,36 +47,32 @@ async def list_tasks(
         raise HTTPException(status_code=401, detail="User ID validation failed")
 
     # Validation: status must be valid enum value
-    if status not in ["all", "pending", "completed"]:
+    if status not in _ALLOWED_STATUSES:
         raise HTTPException(
             status_code=400,
             detail="Status must be 'all', 'pending', or 'completed'"
         )
 
-    # Retrieve tasks using existing CRUD
-    async with AsyncSessionLocal() as db:
+    # Retrieve rows with a Core column select; the status filter runs
+    # in SQL and no ORM Task entities are hydrated just to be
+    # re-serialized into dicts
+    async def _run(db: AsyncSession) -> Dict[str, Any]:
         try:
-            all_tasks = await get_tasks_by_user(db, user_id)
-
-            # Filter by status if not "all"
-            if status == "pending":
-                filtered_tasks = [t for t in all_tasks if not t.completed]
-            elif status == "completed":
-                filtered_tasks = [t for t in all_tasks if t.completed]
-            else:  # status == "all"
-                filtered_tasks = all_tasks
+            rows = await list_task_rows(
+                db, user_id, status=None if status == "all" else status
+            )
 
             # Format response
             tasks_data = [
                 {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "completed": task.completed,
-                    "created_at": task.created_at.isoformat() if task.created_at else None,
-                    "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+                    "id": row["id"],
+                    "title": row["title"],
+                    "description": row["description"],
+                    "completed": row["completed"],
+                    "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+                    "updated_at": row["updated_at"].isoformat() if row["updated_at"] else None,
                 }
-                for task in filtered_tasks
+                for row in rows
             ]
 
             return {
@@ -80,3 +85,8 @@ async def list_tasks(
                 status_code=500,
                 detail=f"Failed to retrieve tasks: {str(e)}"
             )
+
+    if session is not None:
+        return await _run(session)
+    async with AsyncSessionLocal() as db:
+        return await _run(db)
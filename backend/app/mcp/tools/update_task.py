@@ -1,17 +1,65 @@
 """MCP tool: update_task - Modify task details via natural language."""
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
-from app.crud.task import get_task_by_id, update_task as update_task_crud
-from app.schemas.task import TaskUpdate
+from app.crud.task import update_task_atomic
+
+
+class UpdateTaskArgs(BaseModel):
+    """Validated update_task arguments.
+
+    One pydantic-core (Rust) validation pass replaces the Python
+    branch checks this tool previously ran per call.
+    """
+
+    user_id: int = Field(gt=0)
+    task_id: int = Field(gt=0)
+    title: Optional[str] = Field(None, min_length=1, max_length=500)
+    description: Optional[str] = Field(None, max_length=10000)
+
+    @field_validator("title")
+    @classmethod
+    def _strip_title(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return None
+        v = v.strip()
+        if not v:
+            raise ValueError("Title cannot be empty")
+        return v
+
+    @field_validator("description")
+    @classmethod
+    def _strip_description(cls, v: Optional[str]) -> Optional[str]:
+        return v.strip() if v is not None else None
+
+    @model_validator(mode="after")
+    def _require_a_field(self) -> "UpdateTaskArgs":
+        if self.title is None and self.description is None:
+            raise ValueError(
+                "At least one field (title or description) must be provided"
+            )
+        return self
+
+
+def _args_error(exc: ValidationError) -> HTTPException:
+    """Map a ValidationError to the tool's HTTP error contract."""
+    first = exc.errors()[0]
+    if first["loc"] and first["loc"][0] == "user_id":
+        return HTTPException(status_code=401, detail="User ID validation failed")
+    field = first["loc"][0] if first["loc"] else "arguments"
+    return HTTPException(status_code=400, detail=f"{field}: {first['msg']}")
 
 
 async def update_task(
     user_id: int,
     task_id: int,
     title: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    *,
+    session: Optional[AsyncSession] = None,
 ) -> Dict[str, Any]:
     """
     Update task title and/or description.
@@ -24,6 +72,8 @@ async def update_task(
         task_id: ID of the task to update
         title: New title (optional, 1-500 chars)
         description: New description (optional, max 10000 chars)
+        session: Existing database session to reuse across tool calls in
+            one agent turn; a fresh session is opened if omitted
 
     Returns:
         Dict with task_id, status="updated", and new title
@@ -35,63 +85,51 @@ async def update_task(
         >>> await update_task(user_id=1, task_id=42, title="Buy organic groceries")
         {"task_id": 42, "status": "updated", "title": "Buy organic groceries"}
     """
-    # Validation: user_id required
-    if not user_id or user_id <= 0:
-        raise HTTPException(status_code=401, detail="User ID validation failed")
-
-    # Validation: task_id required
-    if not task_id or task_id <= 0:
-        raise HTTPException(status_code=400, detail="Task ID is required")
-
-    # Validation: at least one field must be provided
-    if title is None and description is None:
-        raise HTTPException(
-            status_code=400,
-            detail="At least one field (title or description) must be provided"
+    # All argument checks in one pydantic-core pass
+    try:
+        args = UpdateTaskArgs(
+            user_id=user_id,
+            task_id=task_id,
+            title=title,
+            description=description,
         )
-
-    # Validation: title constraints
-    if title is not None:
-        if not title.strip():
-            raise HTTPException(status_code=400, detail="Title cannot be empty")
-        if len(title) > 500:
-            raise HTTPException(status_code=400, detail="Title must not exceed 500 characters")
-
-    # Validation: description constraints
-    if description is not None and len(description) > 10000:
-        raise HTTPException(status_code=400, detail="Description must not exceed 10000 characters")
+    except ValidationError as exc:
+        raise _args_error(exc)
 
     # Update task
-    async with AsyncSessionLocal() as db:
+    async def _run(db: AsyncSession) -> Dict[str, Any]:
+        # Only the DB call needs the 500 guard; the 404 and the response
+        # build below can't raise, so keeping them outside drops the
+        # except HTTPException: raise re-dispatch from the happy path
         try:
-            # Get task with ownership validation
-            task = await get_task_by_id(db, task_id, user_id)
-
-            if not task:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Task {task_id} not found or does not belong to user"
-                )
-
-            # Prepare update data
-            update_data = TaskUpdate(
-                title=title.strip() if title else None,
-                description=description.strip() if description else None
+            # One UPDATE ... RETURNING enforces ownership and applies
+            # the patch - no prior SELECT round-trip
+            row = await update_task_atomic(
+                db,
+                task_id,
+                user_id,
+                title=args.title,
+                description=args.description,
             )
-
-            # Update task
-            updated_task = await update_task_crud(db, task, update_data)
-
-            return {
-                "task_id": updated_task.id,
-                "status": "updated",
-                "title": updated_task.title,
-            }
-
-        except HTTPException:
-            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to update task: {str(e)}"
             )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task {task_id} not found or does not belong to user"
+            )
+
+        return {
+            "task_id": row.id,
+            "status": "updated",
+            "title": row.title,
+        }
+
+    if session is not None:
+        return await _run(session)
+    async with AsyncSessionLocal() as db:
+        return await _run(db)
@@ -1,12 +1,14 @@
 """Conversation SQLAlchemy model."""
 from datetime import datetime
+from typing import List
 import uuid as uuid_lib
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy import String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Conversation(Base):
@@ -14,17 +16,20 @@ class Conversation(Base):
 
     __tablename__ = "conversations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_lib.uuid4, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(200), nullable=False, default="New Conversation", server_default="New Conversation")
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+    id: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    user_id: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False, default="New Conversation", server_default="New Conversation")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
 
     # Relationships
-    user = relationship("User", back_populates="conversations")
+    user: Mapped["User"] = relationship("User", back_populates="conversations")
     # Rely on database FK cascade (ondelete="CASCADE" in Message model) instead of ORM cascade
     # Use passive_deletes to tell SQLAlchemy to not manage the relationship deletion
-    messages = relationship("Message", back_populates="conversation", passive_deletes='all', order_by="Message.created_at")
+    # lazy="raise" turns any accidental implicit load into an immediate
+    # error instead of a MissingGreenlet (or a hidden N+1) under asyncio;
+    # callers that need messages opt in with selectinload
+    messages: Mapped[List["Message"]] = relationship("Message", back_populates="conversation", passive_deletes='all', order_by="Message.created_at", lazy="raise")
 
     # Indexes
     __table_args__ = (
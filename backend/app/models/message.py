@@ -1,12 +1,14 @@
 """Message SQLAlchemy model."""
 from datetime import datetime
+from typing import Optional, List, Dict, Any
 import uuid as uuid_lib
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, CheckConstraint, Index
+from sqlalchemy import String, Text, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Message(Base):
@@ -14,23 +16,33 @@ class Message(Base):
 
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_lib.uuid4, index=True)
-    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
-    role = Column(String(20), nullable=False, index=True)
-    content = Column(Text, nullable=False)
-    tool_calls = Column(JSON, nullable=True)  # OpenAI tool_calls format: [{"id": "call_abc", "type": "function", "function": {...}}]
-    tool_call_id = Column(String(100), nullable=True)  # For tool role messages - links to assistant's tool_calls[].id
-    name = Column(String(100), nullable=True)  # For tool role messages - function name
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # UUIDv7: messages are the highest-volume insert table, so the
+    # time-ordered prefix matters most here for PK insert locality
+    id: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    conversation_id: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    role: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    tool_calls: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON, nullable=True)  # OpenAI tool_calls format: [{"id": "call_abc", "type": "function", "function": {...}}]
+    tool_call_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # For tool role messages - links to assistant's tool_calls[].id
+    name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # For tool role messages - function name
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Constraints
     __table_args__ = (
         CheckConstraint("role IN ('user', 'assistant', 'system', 'tool')", name="check_role_values"),
-        Index("idx_messages_conversation_created", "conversation_id", "created_at"),
+        # INCLUDE makes the chat-history SELECT (filter by conversation,
+        # order by created_at, read role/content/tool linkage) an
+        # index-only scan with no per-row heap fetch
+        Index(
+            "idx_messages_conversation_created",
+            "conversation_id",
+            "created_at",
+            postgresql_include=["role", "content", "tool_call_id", "name"],
+        ),
     )
 
     # Relationship
-    conversation = relationship("Conversation", back_populates="messages")
+    conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="messages")
 
     def __repr__(self):
         return f"<Message(id={self.id}, conversation_id={self.conversation_id}, role={self.role}, content={self.content[:50]})>"
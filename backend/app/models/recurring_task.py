@@ -1,9 +1,11 @@
 """RecurringTask SQLAlchemy model."""
 from datetime import datetime, date
+from typing import Optional, List
+import uuid
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey
+from sqlalchemy import Integer, String, Text, Boolean, DateTime, Date, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -13,23 +15,23 @@ class RecurringTask(Base):
 
     __tablename__ = "recurring_tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(500), nullable=False)
-    description = Column(Text, default="", nullable=False)
-    recurrence_pattern = Column(String(50), nullable=False)  # 'daily', 'weekly', 'monthly', 'yearly'
-    start_date = Column(Date, nullable=False)  # when to start creating tasks
-    end_date = Column(Date, nullable=True)  # optional end date
-    next_due_at = Column(Date, nullable=False, index=True)  # next date to create task
-    is_active = Column(Boolean, default=True, nullable=False)
-    task_priority_id = Column(Integer, ForeignKey("priorities.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    recurrence_pattern: Mapped[str] = mapped_column(String(50), nullable=False)  # 'daily', 'weekly', 'monthly', 'yearly'
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)  # when to start creating tasks
+    end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)  # optional end date
+    next_due_at: Mapped[date] = mapped_column(Date, nullable=False, index=True)  # next date to create task
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    task_priority_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("priorities.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    owner = relationship("User", back_populates="recurring_tasks")
-    priority_obj = relationship("Priority", back_populates="recurring_tasks")
-    tasks = relationship("Task", back_populates="recurring_task", cascade="all, delete-orphan")
+    owner: Mapped["User"] = relationship("User", back_populates="recurring_tasks")
+    priority_obj: Mapped[Optional["Priority"]] = relationship("Priority", back_populates="recurring_tasks")
+    tasks: Mapped[List["Task"]] = relationship("Task", back_populates="recurring_task", cascade="all, delete-orphan")
 
     @property
     def user_id_str(self) -> str:
@@ -1,8 +1,9 @@
 """Subtask SQLAlchemy model."""
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -12,16 +13,16 @@ class Subtask(Base):
 
     __tablename__ = "subtasks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=True)
-    completed = Column(Boolean, default=False, nullable=False)
-    sort_order = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationship to parent task
-    task = relationship("Task", back_populates="subtasks")
+    task: Mapped["Task"] = relationship("Task", back_populates="subtasks")
 
     def __repr__(self):
         return f"<Subtask(id={self.id}, title={self.title[:30]}, task_id={self.task_id}, completed={self.completed})>"
@@ -1,9 +1,11 @@
 """Task SQLAlchemy model."""
 from datetime import datetime, date
+from typing import Optional, List
+import uuid
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey
+from sqlalchemy import Integer, String, Text, Boolean, DateTime, Date, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -13,14 +15,14 @@ class Priority(Base):
 
     __tablename__ = "priorities"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, nullable=False)
-    level = Column(Integer, nullable=False)  # 1=Low, 2=Medium, 3=High
-    color = Column(String(7), nullable=True)  # Hex color code
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    level: Mapped[int] = mapped_column(Integer, nullable=False)  # 1=Low, 2=Medium, 3=High
+    color: Mapped[Optional[str]] = mapped_column(String(7), nullable=True)  # Hex color code
 
     # Relationship to tasks and recurring_tasks
-    tasks = relationship("Task", back_populates="priority_obj")
-    recurring_tasks = relationship("RecurringTask", back_populates="priority_obj")
+    tasks: Mapped[List["Task"]] = relationship("Task", back_populates="priority_obj")
+    recurring_tasks: Mapped[List["RecurringTask"]] = relationship("RecurringTask", back_populates="priority_obj")
 
 
 class Task(Base):
@@ -28,28 +30,60 @@ class Task(Base):
 
     __tablename__ = "tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    priority_id = Column(Integer, ForeignKey("priorities.id"), nullable=True)  # Foreign key to priorities table
-    title = Column(String(500), nullable=False)
-    description = Column(Text, default="", nullable=False)
-    completed = Column(Boolean, default=False, nullable=False)
-    due_date = Column(Date, nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    is_recurring = Column(Boolean, default=False, nullable=False)
-    recurrence_pattern = Column(String(100), nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # No single-column index: user_id is the leading column of the
+    # idx_tasks_user_completed composite below, which serves the same scans
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    priority_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("priorities.id"), nullable=True)  # Foreign key to priorities table
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    due_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    is_recurring: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    recurrence_pattern: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Phase V: Recurring tasks and notification tracking
-    notified = Column(Boolean, default=False, nullable=False)  # track if due notification sent
-    recurring_task_id = Column(Integer, ForeignKey("recurring_tasks.id", ondelete="SET NULL"), nullable=True)  # link to parent recurring task
+    notified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)  # track if due notification sent
+    recurring_task_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("recurring_tasks.id", ondelete="SET NULL"), nullable=True)  # link to parent recurring task
 
     # Relationships
-    owner = relationship("User", back_populates="tasks")
-    priority_obj = relationship("Priority", back_populates="tasks")
-    subtasks = relationship("Subtask", back_populates="task", cascade="all, delete-orphan")
-    recurring_task = relationship("RecurringTask", back_populates="tasks")
-    event_logs = relationship("TaskEventLog", back_populates="task", cascade="all, delete-orphan")
+    owner: Mapped["User"] = relationship("User", back_populates="tasks")
+    # priorities is a three-row lookup table, so a LEFT OUTER JOIN per
+    # task query is cheaper than the extra selectinload round-trip and
+    # removes the N+1 risk for any site that forgets loader options
+    priority_obj: Mapped[Optional["Priority"]] = relationship("Priority", back_populates="tasks", lazy="joined", innerjoin=False)
+    # passive_deletes=True: the FKs carry ondelete="CASCADE", so task
+    # deletes don't load these collections just to delete them row-wise
+    subtasks: Mapped[List["Subtask"]] = relationship("Subtask", back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
+    recurring_task: Mapped[Optional["RecurringTask"]] = relationship("RecurringTask", back_populates="tasks")
+    event_logs: Mapped[List["TaskEventLog"]] = relationship("TaskEventLog", back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
+
+    # Status-filtered task lists query on (user_id, completed) and sort
+    # by created_at DESC; this composite index makes that an index scan.
+    # created_at is append-only and correlated with page order, so the
+    # analytics range scans (WHERE created_at BETWEEN ...) use a BRIN
+    # index - per-page-range min/max summaries instead of a full btree,
+    # orders of magnitude smaller and nearly free to maintain on INSERT
+    # The "open tasks" partial index only holds rows with
+    # completed = false, so it stays O(open tasks) - and RAM-resident -
+    # no matter how many completed rows accumulate
+    __table_args__ = (
+        Index("idx_tasks_user_completed", user_id, completed, created_at.desc()),
+        Index(
+            "ix_tasks_created_at_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_tasks_open",
+            user_id,
+            created_at.desc(),
+            postgresql_where=(completed == False),  # noqa: E712
+        ),
+    )
 
     @property
     def user_id_str(self) -> str:
@@ -57,7 +91,14 @@ class Task(Base):
         return str(self.user_id)
 
     def __repr__(self):
-        try:
-            return f"<Task(id={self.id}, title={self.title[:30]}, user_id={self.user_id}, completed={self.completed})>"
-        except Exception:
-            return f"<Task(id={getattr(self, 'id', 'Unknown')} [Detached])>"
+        # Read loaded state straight from __dict__: instrumented access
+        # on a detached/expired instance would try a lazy load (and the
+        # old try/except existed only to mask that), while __dict__ is
+        # always safe and free of descriptor overhead
+        d = self.__dict__
+        title = d.get("title")
+        return (
+            f"<Task(id={d.get('id', 'Unknown')}, "
+            f"title={title[:30] if title else ''}, "
+            f"user_id={d.get('user_id')}, completed={d.get('completed')})>"
+        )
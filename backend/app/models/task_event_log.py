@@ -1,9 +1,10 @@
 """TaskEventLog SQLAlchemy model."""
 from datetime import datetime
+from typing import Optional, Dict, Any
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Integer, String, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -13,14 +14,14 @@ class TaskEventLog(Base):
 
     __tablename__ = "task_event_log"
 
-    id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
-    event_type = Column(String(50), nullable=False, index=True)  # 'created', 'updated', 'completed', 'deleted', 'due_soon'
-    event_data = Column(JSONB, nullable=True)  # store event payload
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # 'created', 'updated', 'completed', 'deleted', 'due_soon'
+    event_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # store event payload
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     # Relationships
-    task = relationship("Task", back_populates="event_logs")
+    task: Mapped["Task"] = relationship("Task", back_populates="event_logs")
 
     def __repr__(self):
         try:
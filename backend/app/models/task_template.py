@@ -1,10 +1,11 @@
 """TaskTemplate SQLAlchemy model for reusable task patterns."""
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Any
+import uuid
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -32,30 +33,41 @@ class TaskTemplate(Base):
 
     __tablename__ = "task_templates"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=True)
-    priority_id = Column(Integer, nullable=False, default=2)  # Default Medium
-    is_recurring = Column(Boolean, nullable=False, default=False)
-    recurrence_pattern = Column(String(100), nullable=True)
-    tags = Column(JSON, nullable=True)  # JSON array of tag strings
-    subtasks_template = Column(JSON, nullable=True)  # JSON array of subtask objects
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    priority_id: Mapped[int] = mapped_column(Integer, nullable=False, default=2)  # Default Medium
+    is_recurring: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    recurrence_pattern: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSONB, nullable=True)  # JSONB array of tag strings
+    subtasks_template: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB, nullable=True)  # JSONB array of subtask objects
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         default=datetime.utcnow,
         onupdate=datetime.utcnow,
         nullable=False
     )
 
+    # jsonb_path_ops GIN: index-backed @> containment for
+    # "templates tagged X" lookups
+    __table_args__ = (
+        Index(
+            "ix_task_templates_tags_gin",
+            tags,
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
+
     # Relationship to User
-    owner = relationship("User", back_populates="task_templates")
+    owner: Mapped["User"] = relationship("User", back_populates="task_templates")
 
     def __repr__(self):
         return f"<TaskTemplate(id={self.id}, title={self.title}, user_id={self.user_id})>"
@@ -1,40 +1,61 @@
 """User SQLAlchemy model."""
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, List, Dict, Any
 import uuid
 
-from sqlalchemy import Column, String, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class User(Base):
     """User model for authentication and data ownership.
 
-    Note: This model has two password fields for historical reasons:
-    - hashed_password: Primary field used for authentication (NOT NULL)
-    - password_hash: Legacy field from schema migration, kept for compatibility (nullable)
-
-    When creating users, only set hashed_password. The password_hash field can be NULL.
+    Passwords live in hashed_password; the legacy password_hash column
+    (a duplicate from an old schema migration) was dropped in migration
+    017 once nothing read or wrote it.
     """
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)  # Primary password field
-    name = Column(String(255), nullable=False)
-    password_hash = Column(String(255), nullable=True)  # Legacy field, can be NULL
-    preferences = Column(JSON, nullable=True)  # Store user preferences as JSON
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    # Relationships (one-to-many)
-    tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
-    conversations = relationship("Conversation", back_populates="user", cascade="all, delete-orphan")
-    task_templates = relationship("TaskTemplate", back_populates="owner", cascade="all, delete-orphan")
-    recurring_tasks = relationship("RecurringTask", back_populates="owner", cascade="all, delete-orphan")
+    # Time-ordered UUIDv7 ids keep PK/FK btree inserts on the hot
+    # rightmost page instead of scattering across the whole index
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    preferences: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # Store user preferences as JSONB
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Functional unique index backing the case-insensitive auth lookup
+    # (WHERE lower(email) = :email in get_user_by_email); same index as
+    # migration 010, declared here so metadata.create_all builds it too
+    # jsonb_path_ops GIN: supports @> containment ("users who opted
+    # into feature X") at about a third of the default jsonb_ops size
+    __table_args__ = (
+        Index("users_email_lower", func.lower(email), unique=True),
+        Index(
+            "ix_users_prefs_gin",
+            preferences,
+            postgresql_using="gin",
+            postgresql_ops={"preferences": "jsonb_path_ops"},
+        ),
+    )
+
+    # Relationships (one-to-many). lazy="raise" turns any accidental
+    # collection access on the hot auth path into an immediate error
+    # instead of a silent N+1 (or MissingGreenlet under asyncio);
+    # callers that really need a collection opt in with selectinload.
+    # passive_deletes=True lets a user delete be one DELETE FROM users
+    # with the ondelete="CASCADE" FKs removing children server-side,
+    # instead of the ORM loading every child to emit per-row DELETEs
+    tasks: Mapped[List["Task"]] = relationship("Task", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    conversations: Mapped[List["Conversation"]] = relationship("Conversation", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    task_templates: Mapped[List["TaskTemplate"]] = relationship("TaskTemplate", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    recurring_tasks: Mapped[List["RecurringTask"]] = relationship("RecurringTask", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
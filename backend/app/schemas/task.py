@@ -1,6 +1,6 @@
 """Task Pydantic schemas for request/response validation."""
 from datetime import datetime, date
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from typing import Optional
 from uuid import UUID
 
@@ -65,7 +65,10 @@ class TaskResponse(BaseModel):
     """Schema for task data in responses."""
 
     id: int
-    user_id: str  # UUID string
+    # Typed as UUID so pydantic-core validates the ORM value natively
+    # and renders the canonical string on dump - no Python-level
+    # before-validator firing once per serialized task
+    user_id: UUID
     title: str
     description: str
     completed: bool
@@ -79,11 +82,3 @@ class TaskResponse(BaseModel):
 
     class Config:
         from_attributes = True  # Pydantic v2 (was orm_mode in v1)
-
-    @field_validator('user_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Convert UUID to string for serialization."""
-        if isinstance(v, UUID):
-            return str(v)
-        return v
@@ -1,10 +1,29 @@
 """TaskTemplate Pydantic schemas for request/response validation."""
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
+
+import orjson
 from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
 
 
+@lru_cache(maxsize=1024)
+def _parse_json_list(s: str):
+    """Parse a legacy JSON-string blob, memoized by the exact string.
+
+    Since the JSONB migration the driver hands these columns over as
+    Python lists, so this only runs for string values from older rows;
+    identical blobs across templates parse once. Pydantic copies the
+    result into each model during validation, so sharing the cached
+    list is safe.
+    """
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        return []
+
+
 class TaskTemplateCreate(BaseModel):
     """Schema for task template creation request."""
 
@@ -72,7 +91,7 @@ class TaskTemplateResponse(BaseModel):
     """Schema for task template data in responses."""
 
     id: int
-    user_id: str  # UUID string
+    user_id: UUID  # validated/serialized natively by pydantic-core
     title: str
     description: Optional[str]
     priority_id: int
@@ -86,46 +105,29 @@ class TaskTemplateResponse(BaseModel):
     class Config:
         from_attributes = True
 
-    @field_validator('user_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Convert UUID to string for serialization."""
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
     @field_validator('tags', mode='before')
     @classmethod
     def parse_tags(cls, v):
         """Parse tags from JSON if needed."""
-        if v is None:
-            return None
+        # JSONB rows arrive as lists - check the common case first
         if isinstance(v, list):
             return v
-        # If stored as JSON string, parse it
+        if v is None:
+            return None
         if isinstance(v, str):
-            import json
-            try:
-                return json.loads(v)
-            except:
-                return []
+            return _parse_json_list(v)
         return []
 
     @field_validator('subtasks_template', mode='before')
     @classmethod
     def parse_subtasks(cls, v):
         """Parse subtasks_template from JSON if needed."""
-        if v is None:
-            return None
         if isinstance(v, list):
             return v
-        # If stored as JSON string, parse it
+        if v is None:
+            return None
         if isinstance(v, str):
-            import json
-            try:
-                return json.loads(v)
-            except:
-                return []
+            return _parse_json_list(v)
         return []
 
 
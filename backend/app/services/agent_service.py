@@ -1,8 +1,10 @@
 """AI Agent Service for task management chatbot."""
 from typing import List, Dict, Any, Optional
+import asyncio
 import os
 from openai import AsyncOpenAI
 
+from app.database import AsyncSessionLocal
 from app.mcp.tools.add_task import add_task
 from app.mcp.tools.list_tasks import list_tasks
 from app.mcp.tools.complete_task import complete_task
@@ -201,6 +203,67 @@ class AgentService:
         ]
         return tools
 
+    async def _dispatch_tool_call(self, tool_call) -> Dict[str, Any]:
+        """
+        Execute one tool call on its own pooled session.
+
+        Each dispatch checks out a session from the pool so several
+        tool calls in one turn can run concurrently without sharing
+        transactional state.
+
+        Args:
+            tool_call: OpenAI tool call with function name and arguments
+
+        Returns:
+            Metadata dict with the tool name, parameters and result
+        """
+        function_name = tool_call.function.name
+        function_args = eval(tool_call.function.arguments)  # Parse JSON string
+
+        async with AsyncSessionLocal() as db:
+            # Inject user_id (SECURITY: never from user input)
+            if function_name == "add_task":
+                result = await add_task(
+                    user_id=self.user_id,
+                    title=function_args.get("title"),
+                    description=function_args.get("description", ""),
+                    session=db,
+                )
+            elif function_name == "list_tasks":
+                result = await list_tasks(
+                    user_id=self.user_id,
+                    status=function_args.get("status", "all"),
+                    session=db,
+                )
+            elif function_name == "complete_task":
+                result = await complete_task(
+                    user_id=self.user_id,
+                    task_id=function_args.get("task_id"),
+                    session=db,
+                )
+            elif function_name == "update_task":
+                result = await update_task(
+                    user_id=self.user_id,
+                    task_id=function_args.get("task_id"),
+                    title=function_args.get("title"),
+                    description=function_args.get("description"),
+                    session=db,
+                )
+            elif function_name == "delete_task":
+                result = await delete_task(
+                    user_id=self.user_id,
+                    task_id=function_args.get("task_id"),
+                    session=db,
+                )
+            else:
+                result = {"error": f"Unknown tool: {function_name}"}
+
+        return {
+            "tool": function_name,
+            "parameters": function_args,
+            "result": result,
+        }
+
     async def process_message(
         self, message_history: List[Dict[str, str]], user_message: str
     ) -> Dict[str, Any]:
@@ -247,95 +310,21 @@ class AgentService:
             assistant_message = response.choices[0].message
             tool_calls_metadata = []
 
-            # Handle tool calls if any
+            # Handle tool calls if any. A single call (the common case)
+            # runs inline; when the model returns several, they run
+            # concurrently via asyncio.gather, each on its own pooled
+            # session, so the turn costs the slowest tool rather than
+            # the sum of all of them.
             if assistant_message.tool_calls:
-                for tool_call in assistant_message.tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = eval(tool_call.function.arguments)  # Parse JSON string
-
-                    # Execute the appropriate tool
-                    if function_name == "add_task":
-                        # Inject user_id (SECURITY: never from user input)
-                        result = await add_task(
-                            user_id=self.user_id,
-                            title=function_args.get("title"),
-                            description=function_args.get("description", ""),
-                        )
-
-                        # Track tool call for response
-                        tool_calls_metadata.append(
-                            {
-                                "tool": function_name,
-                                "parameters": function_args,
-                                "result": result,
-                            }
-                        )
-
-                    elif function_name == "list_tasks":
-                        # Inject user_id (SECURITY: never from user input)
-                        result = await list_tasks(
-                            user_id=self.user_id,
-                            status=function_args.get("status", "all"),
-                        )
-
-                        # Track tool call for response
-                        tool_calls_metadata.append(
-                            {
-                                "tool": function_name,
-                                "parameters": function_args,
-                                "result": result,
-                            }
-                        )
-
-                    elif function_name == "complete_task":
-                        # Inject user_id (SECURITY: never from user input)
-                        result = await complete_task(
-                            user_id=self.user_id,
-                            task_id=function_args.get("task_id"),
-                        )
-
-                        # Track tool call for response
-                        tool_calls_metadata.append(
-                            {
-                                "tool": function_name,
-                                "parameters": function_args,
-                                "result": result,
-                            }
-                        )
-
-                    elif function_name == "update_task":
-                        # Inject user_id (SECURITY: never from user input)
-                        result = await update_task(
-                            user_id=self.user_id,
-                            task_id=function_args.get("task_id"),
-                            title=function_args.get("title"),
-                            description=function_args.get("description"),
-                        )
-
-                        # Track tool call for response
-                        tool_calls_metadata.append(
-                            {
-                                "tool": function_name,
-                                "parameters": function_args,
-                                "result": result,
-                            }
-                        )
-
-                    elif function_name == "delete_task":
-                        # Inject user_id (SECURITY: never from user input)
-                        result = await delete_task(
-                            user_id=self.user_id,
-                            task_id=function_args.get("task_id"),
-                        )
-
-                        # Track tool call for response
-                        tool_calls_metadata.append(
-                            {
-                                "tool": function_name,
-                                "parameters": function_args,
-                                "result": result,
-                            }
+                calls = assistant_message.tool_calls
+                if len(calls) == 1:
+                    tool_calls_metadata = [await self._dispatch_tool_call(calls[0])]
+                else:
+                    tool_calls_metadata = list(
+                        await asyncio.gather(
+                            *(self._dispatch_tool_call(tc) for tc in calls)
                         )
+                    )
 
                 # Generate follow-up response after tool execution
                 # In a real implementation, we'd send the tool results back to the model
@@ -2,6 +2,7 @@
 import os
 import sys
 import logging
+import traceback
 from typing import Dict, Any, Optional
 import httpx
 from datetime import datetime
@@ -74,7 +75,6 @@ class DaprEventPublisher:
             return False
         except Exception as e:
             print(f"[DAPR-PUB] Unexpected error publishing event to topic '{topic}': {e}", file=sys.stderr)
-            import traceback
             traceback.print_exc(file=sys.stderr)
             return False
 
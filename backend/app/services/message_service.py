@@ -6,12 +6,13 @@ Supports formatting message history for OpenAI Agents SDK.
 """
 
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, asc, desc, update
+from sqlalchemy import select, asc, desc, insert, update
 
 from app.models.message import Message
 from app.models.conversation import Conversation
+from app.utils.uuid7 import uuid7
 
 
 class MessageService:
@@ -249,36 +250,37 @@ class MessageService:
                 ]
             )
         """
-        created_messages = []
-
-        for msg_dict in messages:
+        # One executemany INSERT instead of a round-trip per message.
+        # IDs and timestamps are generated Python-side, so no RETURNING
+        # (and no per-message refresh) is needed; timestamps are
+        # staggered by a microsecond to keep created_at ordering
+        # deterministic within the batch.
+        now = datetime.utcnow()
+        rows = []
+        for i, msg_dict in enumerate(messages):
             role = msg_dict.get("role")
-            content = msg_dict.get("content")
 
             if role not in ("user", "assistant"):
                 raise ValueError(f"Invalid role in message: {role}")
 
-            message = Message(
-                conversation_id=conversation_id,
-                role=role,
-                content=content,
-                created_at=datetime.utcnow()
-            )
+            rows.append({
+                "id": uuid7(),
+                "conversation_id": conversation_id,
+                "role": role,
+                "content": msg_dict.get("content"),
+                "created_at": now + timedelta(microseconds=i),
+            })
 
-            self.session.add(message)
-            created_messages.append(message)
+        if rows:
+            await self.session.execute(insert(Message), rows)
 
         # Update conversation's updated_at timestamp
         await self.session.execute(
             update(Conversation)
             .where(Conversation.id == conversation_id)
-            .values(updated_at=datetime.utcnow())
+            .values(updated_at=now)
         )
 
         await self.session.commit()
 
-        # Refresh all messages to get their IDs
-        for message in created_messages:
-            await self.session.refresh(message)
-
-        return created_messages
+        return [Message(**row) for row in rows]
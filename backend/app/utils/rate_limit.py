@@ -1,28 +1,74 @@
-"""Rate limiting utilities with testing support."""
+"""Rate limiting utilities with testing support.
+
+Token-bucket rate limiting applied as ASGI middleware (see
+app.main.rate_limit_middleware). With REDIS_URL configured the buckets
+live in Redis and are updated by a single EVALSHA of the Lua script
+below - one round-trip, fully atomic, no WATCH/MULTI retry loop and no
+sync-client threadpool hop. Without Redis (local dev) an in-process
+fallback applies the same bucket math per worker.
+"""
 import os
-from functools import wraps
-from typing import Callable, Any
+import time
+from typing import Dict, Tuple
 
 # Rate limiting is disabled during testing
 TESTING = os.getenv("TESTING", "false").lower() == "true"
 
+# Refill-and-take in one atomic script: read the bucket hash, top it up
+# for elapsed time, take a token if available, persist, and TTL the key
+# at twice the full-refill time so idle buckets expire on their own.
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now_ms = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1])
+local last_refill = tonumber(bucket[2])
+if tokens == nil then
+    tokens = capacity
+    last_refill = now_ms
+end
+local elapsed = math.max(0, now_ms - last_refill) / 1000.0
+tokens = math.min(capacity, tokens + elapsed * refill_rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', key, 'tokens', tokens, 'last_refill', now_ms)
+redis.call('PEXPIRE', key, math.ceil(capacity / refill_rate * 2000))
+return allowed
+"""
+
+# Per-route buckets as (capacity, refill tokens/second). Auth endpoints
+# keep the old 5/minute decorator limits; everything else shares the
+# default bucket.
+ROUTE_BUCKETS: Dict[str, Tuple[int, float]] = {
+    "/api/auth/register": (5, 5 / 60),
+    "/api/auth/login": (5, 5 / 60),
+}
+DEFAULT_BUCKET: Tuple[int, float] = (60, 1.0)
 
-def conditional_rate_limit(limiter, rate: str):
-    """
-    Apply rate limiting conditionally - disabled during testing.
 
-    Args:
-        limiter: The slowapi Limiter instance
-        rate: Rate string (e.g., "5/minute")
+class LocalTokenBuckets:
+    """In-process token buckets for development without Redis.
 
-    Returns:
-        Decorator function
+    Same refill math as the Lua script, but per worker - limits are
+    effectively multiplied by worker count, which is acceptable for the
+    no-Redis fallback only.
     """
-    def decorator(func: Callable) -> Callable:
-        if TESTING:
-            # Return the function unchanged during tests
-            return func
-        else:
-            # Apply rate limiting in production
-            return limiter.limit(rate)(func)
-    return decorator
\ No newline at end of file
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def allow(self, key: str, capacity: int, refill_rate: float) -> bool:
+        """Take a token from ``key``'s bucket; True if one was available."""
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - last_refill) * refill_rate)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+        return allowed
@@ -1,4 +1,5 @@
 """Security utilities for password hashing and JWT token management."""
+import asyncio
 import bcrypt
 import hashlib
 from datetime import datetime, timedelta
@@ -9,16 +10,8 @@ from jose import JWTError, jwt
 from app.config import settings
 
 
-def hash_password(password: str) -> str:
-    """
-    Hash a plain text password using bcrypt.
-
-    Args:
-        password: Plain text password
-
-    Returns:
-        Hashed password string
-    """
+def _hash_password_sync(password: str) -> str:
+    """Hash a password with bcrypt (blocking; run in a thread from async code)."""
     # bcrypt has a 72 byte limit, truncate if necessary
     if len(password.encode('utf-8')) > 72:
         password = password[:72]
@@ -29,17 +22,25 @@ def hash_password(password: str) -> str:
     return hashed.decode('utf-8')
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def hash_password(password: str) -> str:
     """
-    Verify a plain text password against a hashed password.
+    Hash a plain text password using bcrypt.
+
+    bcrypt takes on the order of 100ms at default cost, so the hash runs
+    in a worker thread to avoid stalling the event loop (bcrypt releases
+    the GIL while hashing).
 
     Args:
-        plain_password: Plain text password to verify
-        hashed_password: Hashed password to compare against
+        password: Plain text password
 
     Returns:
-        True if password matches, False otherwise
+        Hashed password string
     """
+    return await asyncio.to_thread(_hash_password_sync, password)
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """Check a password with bcrypt (blocking; run in a thread from async code)."""
     # bcrypt has a 72 byte limit, truncate if necessary
     if len(plain_password.encode('utf-8')) > 72:
         plain_password = plain_password[:72]
@@ -54,6 +55,25 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain text password against a hashed password.
+
+    Like hash_password, the bcrypt check costs ~100ms of CPU, so it runs
+    in a worker thread to keep the event loop free during logins.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await asyncio.to_thread(
+        _verify_password_sync, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -0,0 +1,31 @@
+"""One-shot Alembic migration entrypoint.
+
+Run once per deployment (k8s Job, release command, or CI step) before
+rolling out app workers:
+
+    python migrate.py
+
+Keeping migrations out of the FastAPI lifespan means a single process
+runs them instead of every autoscaled worker importing Alembic, scanning
+the versions directory and queueing behind the same advisory lock at
+startup. The app itself only verifies the schema version at boot (see
+app.main.lifespan).
+"""
+import logging
+
+from alembic import command
+from alembic.config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Upgrade the database to the latest Alembic head."""
+    alembic_cfg = Config("alembic.ini")
+    command.upgrade(alembic_cfg, "head")
+    logger.info("Database migrations complete")
+
+
+if __name__ == "__main__":
+    main()
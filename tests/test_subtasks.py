@@ -63,7 +63,7 @@ async def test_user(db_session: AsyncSession):
     """Create a test user."""
     user = User(
         email="test@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=await hash_password("testpass123"),
         name="Test User",
     )
     db_session.add(user)
@@ -243,7 +243,7 @@ async def test_subtask_data_isolation(db_session: AsyncSession, auth_headers: di
     # Create another user and task
     other_user = User(
         email="other@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=await hash_password("testpass123"),
         name="Other User",
     )
     db_session.add(other_user)